@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import logging
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from onehaven_platform.backend.src.config import settings
+from onehaven_platform.backend.src.db import SessionLocal
 from onehaven_platform.backend.src.logging_config import configure_logging
 from onehaven_platform.backend.src.middleware.request_id import RequestIDMiddleware
 from onehaven_platform.backend.src.middleware.structured_logging import StructuredLoggingMiddleware
+from onehaven_platform.backend.src.services.plan_service import ensure_default_plans
 
 from apps.suite_api.app.api.health.health import router as health_router
 from apps.suite_api.app.api.health.meta import router as meta_router
@@ -38,6 +42,7 @@ from products.compliance.backend.src.routers.policy_seed import router as policy
 from products.compliance.backend.src.routers.policy_evidence import router as policy_evidence_router
 from products.compliance.backend.src.routers.policy import router as policy_router
 from products.compliance.backend.src.routers.policy_catalog_admin import router as policy_catalog_admin_router
+from products.compliance.backend.src.services.policy_seed import ensure_policy_seeded
 
 from products.tenants.backend.src.routers.tenants import router as tenants_router
 
@@ -52,6 +57,8 @@ from onehaven_platform.backend.src.integrations.ingestion_router import router a
 
 API_PREFIX = "/api"
 
+log = logging.getLogger("onehaven.startup")
+
 
 def _dev_origin_allowlist() -> list[str]:
     return [
@@ -85,6 +92,22 @@ def _cors_origins() -> list[str]:
     return _dev_origin_allowlist()
 
 
+def _seed_reference_data() -> None:
+    """
+    Bootstrap the global plan and policy rows once per process so request
+    paths (plan limits, policy lookups) never have to check for them.
+    """
+    db = SessionLocal()
+    try:
+        ensure_default_plans(db)
+        ensure_policy_seeded(db)
+    except Exception:
+        db.rollback()
+        log.exception("startup_reference_seed_failed")
+    finally:
+        db.close()
+
+
 def create_app() -> FastAPI:
     configure_logging()
 
@@ -146,6 +169,8 @@ def create_app() -> FastAPI:
     app.include_router(automation_router, prefix=API_PREFIX)
     app.include_router(ingestion_router, prefix=API_PREFIX)
 
+    app.add_event_handler("startup", _seed_reference_data)
+
     return app
 
 
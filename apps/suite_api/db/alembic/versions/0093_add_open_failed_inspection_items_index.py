@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "0093_add_open_failed_inspection_items_index"
+down_revision = "0092_add_registry_completeness_metadata"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_inspection_items_open_failed"
+
+
+def _insp():
+    return inspect(op.get_bind())
+
+
+def _has_table(name: str) -> bool:
+    return name in _insp().get_table_names()
+
+
+def _has_index(table: str, idx_name: str) -> bool:
+    if not _has_table(table):
+        return False
+    return idx_name in {idx["name"] for idx in _insp().get_indexes(table)}
+
+
+def upgrade() -> None:
+    if not _has_table("inspection_items"):
+        return
+
+    # Open failures are a small slice of inspection_items; a partial index keeps
+    # the per-property count in the state machine an index-only scan.
+    if not _has_index("inspection_items", INDEX_NAME):
+        op.create_index(
+            INDEX_NAME,
+            "inspection_items",
+            ["inspection_id"],
+            unique=False,
+            postgresql_where=sa.text("failed = true AND resolved_at IS NULL"),
+        )
+
+
+def downgrade() -> None:
+    if _has_index("inspection_items", INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name="inspection_items")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from alembic import op
+from sqlalchemy import inspect
+
+revision = "0094_add_latest_row_lookup_indexes"
+down_revision = "0093_add_open_failed_inspection_items_index"
+branch_labels = None
+depends_on = None
+
+
+# The state machine reads the newest row per property from each of these
+# tables (ORDER BY ... DESC LIMIT 1). Ending every index in the sort columns
+# lets Postgres answer with a backward index scan instead of a sort.
+INDEXES = (
+    ("deals", "ix_deals_org_property_updated_at", ["org_id", "property_id", "updated_at", "id"]),
+    ("underwriting_results", "ix_underwriting_results_deal_created_at", ["deal_id", "created_at", "id"]),
+    ("inspections", "ix_inspections_org_property_date", ["org_id", "property_id", "inspection_date", "id"]),
+    ("transactions", "ix_transactions_org_property_id", ["org_id", "property_id", "id"]),
+    ("valuations", "ix_valuations_org_property_id", ["org_id", "property_id", "id"]),
+)
+
+
+def _insp():
+    return inspect(op.get_bind())
+
+
+def _has_table(name: str) -> bool:
+    return name in _insp().get_table_names()
+
+
+def _has_index(table: str, idx_name: str) -> bool:
+    if not _has_table(table):
+        return False
+    return idx_name in {idx["name"] for idx in _insp().get_indexes(table)}
+
+
+def upgrade() -> None:
+    for table, name, columns in INDEXES:
+        if _has_table(table) and not _has_index(table, name):
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade() -> None:
+    for table, name, _columns in reversed(INDEXES):
+        if _has_index(table, name):
+            op.drop_index(name, table_name=table)
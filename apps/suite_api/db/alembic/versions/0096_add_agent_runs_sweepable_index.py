@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "0096_add_agent_runs_sweepable_index"
+down_revision = "0095_add_usage_ledger_covering_index"
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = "ix_agent_runs_sweepable"
+
+
+def _insp():
+    return inspect(op.get_bind())
+
+
+def _has_table(name: str) -> bool:
+    return name in _insp().get_table_names()
+
+
+def _has_index(table: str, idx_name: str) -> bool:
+    if not _has_table(table):
+        return False
+    return idx_name in {idx["name"] for idx in _insp().get_indexes(table)}
+
+
+def upgrade() -> None:
+    if not _has_table("agent_runs"):
+        return
+
+    # The stuck-run sweeper only looks at queued/running rows, newest first;
+    # indexing just those keeps it proportional to in-flight runs rather than
+    # the whole run history.
+    if not _has_index("agent_runs", INDEX_NAME):
+        op.create_index(
+            INDEX_NAME,
+            "agent_runs",
+            ["id"],
+            unique=False,
+            postgresql_where=sa.text("status IN ('queued', 'running')"),
+        )
+
+
+def downgrade() -> None:
+    if _has_index("agent_runs", INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name="agent_runs")
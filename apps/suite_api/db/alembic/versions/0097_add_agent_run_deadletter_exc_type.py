@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+revision = "0097_add_agent_run_deadletter_exc_type"
+down_revision = "0096_add_agent_runs_sweepable_index"
+branch_labels = None
+depends_on = None
+
+
+TABLE_NAME = "agent_run_deadletters"
+INDEX_NAME = "ix_agent_run_deadletters_exc_type"
+
+
+def _insp():
+    return inspect(op.get_bind())
+
+
+def _has_table(name: str) -> bool:
+    return name in _insp().get_table_names()
+
+
+def _has_column(table: str, column: str) -> bool:
+    if not _has_table(table):
+        return False
+    return column in {col["name"] for col in _insp().get_columns(table)}
+
+
+def _has_index(table: str, idx_name: str) -> bool:
+    if not _has_table(table):
+        return False
+    return idx_name in {idx["name"] for idx in _insp().get_indexes(table)}
+
+
+def upgrade() -> None:
+    if not _has_table(TABLE_NAME):
+        return
+
+    # Exception class kept apart from the (now length-capped) error text, so
+    # deadletters can be grouped and filtered without scanning error bodies.
+    if not _has_column(TABLE_NAME, "exc_type"):
+        op.add_column(TABLE_NAME, sa.Column("exc_type", sa.String(length=120), nullable=True))
+
+    if not _has_index(TABLE_NAME, INDEX_NAME):
+        op.create_index(INDEX_NAME, TABLE_NAME, ["exc_type"], unique=False)
+
+
+def downgrade() -> None:
+    if _has_index(TABLE_NAME, INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
+    if _has_column(TABLE_NAME, "exc_type"):
+        op.drop_column(TABLE_NAME, "exc_type")
@@ -9,6 +9,9 @@ class Settings(BaseSettings):
     # ---- App ----
     app_env: str = "local"
     database_url: str = "sqlite:///./onehaven.db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_recycle_seconds: int = 1800
 
     # ---- CORS ----
     cors_allow_origins: list[str] | str = ["*"]
@@ -158,9 +161,16 @@ class Settings(BaseSettings):
     celery_broker_url: str | None = None
     celery_result_backend: str | None = None
     celery_queue: str = "celery"
+    celery_trust_queue: str | None = None
+    celery_agents_long_queue: str | None = None
+    celery_agents_fast_queue: str | None = None
     celery_task_always_eager: bool = False
     celery_task_eager_propagates: bool = True
     celery_worker_max_tasks_per_child: int = 200
+    celery_worker_pool: str = "prefork"
+    celery_worker_concurrency: int | None = None
+    celery_visibility_timeout_seconds: int = 3600
+    celery_prefetch_multiplier: int = 2
     celery_beat_schedule_filename: str = "celerybeat-schedule"
     celery_default_task_soft_time_limit_seconds: int = 600
     celery_default_task_hard_time_limit_seconds: int = 900
@@ -172,6 +182,7 @@ class Settings(BaseSettings):
     agents_max_running_per_org: int = 3
     agents_enable_org_concurrency_guard: bool = True
     agents_enable_pg_advisory_locks: bool = True
+    agents_cli_worker_concurrency: int = 4
 
     # ---- Agent orchestration toggles ----
     agents_enable_auto_planning: bool = True
@@ -11,12 +11,30 @@ class Base(DeclarativeBase):
     pass
 
 
+
+def _pool_options(database_url: str) -> dict[str, int]:
+    # SQLite (local/dev) keeps SQLAlchemy's default pool; server databases get
+    # one sized QueuePool per process, shared by API requests and worker tasks.
+    if str(database_url).startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": int(settings.db_pool_size),
+        "max_overflow": int(settings.db_max_overflow),
+        "pool_recycle": int(settings.db_pool_recycle_seconds),
+    }
+
+
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
     future=True,
+    **_pool_options(settings.database_url),
 )
 
+# Same pool; each statement commits on its own. For single-statement progress
+# writes that need no transaction around them.
+autocommit_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
@@ -24,6 +42,16 @@ SessionLocal = sessionmaker(
     future=True,
 )
 
+# Worker tasks hold on to the rows they load and refresh explicitly where
+# another writer may have changed them, so commits need not expire state.
+WorkerSessionLocal = sessionmaker(
+    bind=engine,
+    autoflush=False,
+    autocommit=False,
+    expire_on_commit=False,
+    future=True,
+)
+
 
 def rollback_quietly(db: Session | None) -> None:
     if db is None:
@@ -1,7 +1,6 @@
 # events.py - centralized event emission for workflow and audit events, with backwards compatibility for both principal-based and explicit org_id/actor_user_id styles.
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Any, Optional
 
@@ -9,6 +8,12 @@ from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.auth import Principal
 from onehaven_platform.backend.src.models import WorkflowEvent, AuditEvent
+from onehaven_platform.backend.src.shared_kernel import json_codec
+
+
+def _dumps(v: Any) -> str:
+    # Unsupported types (datetime included) raise TypeError, as with json.
+    return json_codec.dumps(v)
 
 
 def emit_workflow_event(
@@ -51,7 +56,7 @@ def emit_workflow_event(
         property_id=int(property_id) if property_id is not None else None,
         actor_user_id=eff_actor_user_id,
         event_type=str(event_type),
-        payload_json=json.dumps(payload or {}, ensure_ascii=False),
+        payload_json=_dumps(payload or {}),
         created_at=datetime.utcnow(),
     )
     db.add(ev)
@@ -91,8 +96,8 @@ def emit_audit_event(
         action=str(action),
         entity_type=str(entity_type),
         entity_id=str(entity_id),
-        before_json=json.dumps(before, ensure_ascii=False) if before is not None else None,
-        after_json=json.dumps(after, ensure_ascii=False) if after is not None else None,
+        before_json=_dumps(before) if before is not None else None,
+        after_json=_dumps(after) if after is not None else None,
         created_at=datetime.utcnow(),
     )
     db.add(ae)
@@ -205,14 +205,17 @@ def create_key(payload: dict[str, Any], db: Session = Depends(get_db), principal
     if hasattr(row, "last_used_at"):
         setattr(row, "last_used_at", None)
 
+    # Take the PK at flush time; the response is built from local values, so
+    # there is no need to reload the row after commit.
     db.add(row)
+    db.flush()
+    key_id = int(row.id)
     db.commit()
-    db.refresh(row)
 
     return {
         "ok": True,
-        "id": int(row.id),
-        "name": row.name,
+        "id": key_id,
+        "name": name,
         "api_key": raw,
         "key_prefix": key_prefix,
         "scopes": scopes,
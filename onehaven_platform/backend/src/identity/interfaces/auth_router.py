@@ -145,6 +145,7 @@ def register(payload: dict[str, Any], request: Request, response: Response, db:
             kwargs["created_at"] = _now()
         db.add(OrgSubscription(**kwargs))
         db.commit()
+        plan_service.invalidate_plan_limits(int(org.id))
 
     token = _issue_token_for_org(user_id=int(user.id), org_slug=str(org.slug))
     _set_auth_cookie(response, request, token)
@@ -1,17 +1,20 @@
 # backend/app/services/rentcast_service.py
 from __future__ import annotations
 
-import json
+import copy
 import statistics
+import threading
+import time
 import urllib.parse
-import urllib.request
 from dataclasses import dataclass
 from typing import Any, Optional
 
-from sqlalchemy import delete
+import httpx
+from sqlalchemy import delete, insert
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.models import RentComp
+from onehaven_platform.backend.src.shared_kernel import json_codec
 
 
 @dataclass(frozen=True)
@@ -36,26 +39,63 @@ class RentCastSaleListingResult:
     raw_json: dict[str, Any]
 
 
+_HTTP_CLIENT: httpx.Client | None = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+# Auth header style RentCast last accepted; tried first on the next request.
+_AUTH_STYLES = ("X-Api-Key", "Bearer")
+_preferred_auth_style = _AUTH_STYLES[0]
+
+# Fallback top-level keys for the comparables list, after "comparables" and
+# data.comparables, and the per-comp rent keys in priority order.
+_ALT_COMPARABLES_KEYS = ("comps", "rent_comps", "comparablesList")
+_COMP_RENT_KEYS = ("rent", "price", "rentEstimate", "estimatedRent", "value", "monthlyRent")
+
+# Rent estimates for the same key and property inputs are reused for an
+# hour; retries and repeated enrichments then skip the HTTP round-trip.
+_RENT_ESTIMATE_TTL_SECONDS = 3600.0
+_RENT_ESTIMATE_CACHE_MAX = 1024
+_rent_estimate_cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+
+
+def _http_client() -> httpx.Client:
+    """
+    Process-wide keep-alive client, so repeated lookups reuse the TLS
+    connection to api.rentcast.io instead of handshaking on every call.
+    """
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        with _HTTP_CLIENT_LOCK:
+            if _HTTP_CLIENT is None:
+                _HTTP_CLIENT = httpx.Client(
+                    limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+                )
+    return _HTTP_CLIENT
+
+
 def _http_get_json(url: str, headers: dict[str, str], timeout_s: int = 20) -> HttpResp:
-    req = urllib.request.Request(url, headers=headers, method="GET")
     try:
-        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-            try:
-                payload = json.loads(raw) if raw else None
-            except json.JSONDecodeError:
-                payload = {"_raw": raw}
-            return HttpResp(status=int(resp.status), data=payload)
+        resp = _http_client().get(url, headers=headers, timeout=timeout_s)
     except Exception as e:
         return HttpResp(status=0, data={"error": str(e), "url": url})
 
+    body = resp.content
+    try:
+        if not body:
+            payload = None
+        else:
+            payload = json_codec.loads(body)
+    except ValueError:
+        payload = {"_raw": body.decode("utf-8", errors="replace")}
+    return HttpResp(status=int(resp.status_code), data=payload)
+
 
 class RentCastClient:
     """
-    Small, dependency-free RentCast client.
+    Small RentCast client over a shared httpx connection pool.
     Semantics:
-      - tries X-Api-Key header first
-      - falls back to Authorization: Bearer
+      - tries the auth style that last succeeded (X-Api-Key initially)
+      - falls back to the other style (Authorization: Bearer)
     """
 
     RENT_BASE = "https://api.rentcast.io/v1/avm/rent/long-term"
@@ -66,23 +106,34 @@ class RentCastClient:
             raise ValueError("RENTCAST_API_KEY is missing")
         self.api_key = api_key
 
+    def _auth_headers(self, style: str) -> dict[str, str]:
+        if style == "Bearer":
+            return {"Authorization": f"Bearer {self.api_key}"}
+        return {"X-Api-Key": self.api_key}
+
     def _request_json(self, url: str) -> dict[str, Any] | list[Any] | None:
-        resp1 = _http_get_json(url, {"X-Api-Key": self.api_key})
+        global _preferred_auth_style
+
+        first = _preferred_auth_style
+        second = _AUTH_STYLES[1] if first == _AUTH_STYLES[0] else _AUTH_STYLES[0]
+
+        resp1 = _http_get_json(url, self._auth_headers(first))
         if resp1.status == 200:
             return resp1.data
 
-        resp2 = _http_get_json(url, {"Authorization": f"Bearer {self.api_key}"})
+        resp2 = _http_get_json(url, self._auth_headers(second))
         if resp2.status == 200:
+            _preferred_auth_style = second
             return resp2.data
 
         raise RuntimeError(
             "RentCast request failed. "
-            f"X-Api-Key status={resp1.status} body={resp1.data} | "
-            f"Bearer status={resp2.status} body={resp2.data}"
+            f"{first} status={resp1.status} body={resp1.data} | "
+            f"{second} status={resp2.status} body={resp2.data}"
         )
 
-    def rent_estimate(
-        self,
+    @staticmethod
+    def _rent_estimate_params(
         *,
         address: str,
         city: str,
@@ -102,11 +153,70 @@ class RentCastClient:
         }
         if square_feet:
             params["squareFootage"] = int(square_feet)
+        return params
+
+    def _rent_estimate_cache_key(self, params: dict[str, Any]) -> tuple[Any, ...]:
+        # hash() of the key keeps tenants apart without holding the raw key.
+        return (
+            hash(self.api_key),
+            str(params["address"] or "").strip().lower(),
+            str(params["city"] or "").strip().lower(),
+            str(params["state"] or "").strip().upper(),
+            str(params["zip"] or "").strip(),
+            params["bedrooms"],
+            params["bathrooms"],
+            params.get("squareFootage"),
+        )
+
+    def cached_rent_estimate(self, **kwargs: Any) -> Optional[dict[str, Any]]:
+        """
+        rent_estimate's payload if a fresh copy is cached, else None; takes
+        the same keyword arguments. Lets callers skip budget on a hit.
+        """
+        key = self._rent_estimate_cache_key(self._rent_estimate_params(**kwargs))
+        hit = _rent_estimate_cache.get(key)
+        if hit is None or hit[0] <= time.monotonic():
+            return None
+        return copy.deepcopy(hit[1])
+
+    def rent_estimate(
+        self,
+        *,
+        address: str,
+        city: str,
+        state: str,
+        zip_code: str,
+        bedrooms: int,
+        bathrooms: float,
+        square_feet: Optional[int],
+    ) -> dict[str, Any]:
+        params = self._rent_estimate_params(
+            address=address,
+            city=city,
+            state=state,
+            zip_code=zip_code,
+            bedrooms=bedrooms,
+            bathrooms=bathrooms,
+            square_feet=square_feet,
+        )
+        key = self._rent_estimate_cache_key(params)
+        now = time.monotonic()
+        hit = _rent_estimate_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return copy.deepcopy(hit[1])
 
         qs = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
         url = f"{self.RENT_BASE}?{qs}"
         payload = self._request_json(url)
-        return payload if isinstance(payload, dict) else {"data": payload}
+        result = payload if isinstance(payload, dict) else {"data": payload}
+
+        if len(_rent_estimate_cache) >= _RENT_ESTIMATE_CACHE_MAX:
+            for stale in [k for k, (expires, _) in list(_rent_estimate_cache.items()) if expires <= now]:
+                _rent_estimate_cache.pop(stale, None)
+            while len(_rent_estimate_cache) >= _RENT_ESTIMATE_CACHE_MAX:
+                _rent_estimate_cache.pop(next(iter(_rent_estimate_cache)), None)
+        _rent_estimate_cache[key] = (now + _RENT_ESTIMATE_TTL_SECONDS, copy.deepcopy(result))
+        return result
 
     def sale_listing_lookup(
         self,
@@ -358,41 +468,40 @@ class RentCastClient:
         return None
 
     @staticmethod
-    def _extract_comparables(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    def _extract_comparables(payload: dict[str, Any]) -> list[Any]:
+        """
+        The raw comparables list. Entries are not filtered here; callers skip
+        non-dict items inline so the list is walked once.
+        """
         if not isinstance(payload, dict):
             return []
 
         comps = payload.get("comparables")
-        if isinstance(comps, list):
-            return [c for c in comps if isinstance(c, dict)]
-
-        data = payload.get("data")
-        if isinstance(data, dict) and isinstance(data.get("comparables"), list):
-            return [c for c in data.get("comparables") if isinstance(c, dict)]
-
-        for k in ("comps", "rent_comps", "comparablesList"):
-            v = payload.get(k)
-            if isinstance(v, list):
-                return [c for c in v if isinstance(c, dict)]
-
-        return []
+        if not isinstance(comps, list):
+            data = payload.get("data")
+            comps = data.get("comparables") if isinstance(data, dict) else None
+        if not isinstance(comps, list):
+            comps = next((v for k in _ALT_COMPARABLES_KEYS if isinstance(v := payload.get(k), list)), None)
+        return comps if comps is not None else []
 
     @staticmethod
     def _extract_comp_rents(payload: dict[str, Any]) -> list[float]:
         out: list[float] = []
-        comps = RentCastClient._extract_comparables(payload)
-        for c in comps:
-            for k in ("rent", "price", "rentEstimate", "estimatedRent", "value", "monthlyRent"):
+        for c in RentCastClient._extract_comparables(payload):
+            if not isinstance(c, dict):
+                continue
+            # First key holding a positive number wins, same as before.
+            for k in _COMP_RENT_KEYS:
                 v = c.get(k)
                 if v is None:
                     continue
                 try:
                     fv = float(v)
-                    if fv > 0:
-                        out.append(fv)
-                        break
                 except Exception:
                     continue
+                if fv > 0:
+                    out.append(fv)
+                    break
         return out
 
     @staticmethod
@@ -412,6 +521,8 @@ class RentCastClient:
             return None
 
         for c in comps:
+            if not isinstance(c, dict):
+                continue
             st = str(c.get("stateFips") or "").strip()
             co = str(c.get("countyFips") or "").strip()
             if not (st.isdigit() and co.isdigit()):
@@ -436,6 +547,8 @@ def persist_rentcast_comps_and_get_median(
 
     normalized: list[dict[str, Any]] = []
     for c in comps:
+        if not isinstance(c, dict):
+            continue
         r = c.get("rent") or c.get("price") or c.get("monthlyRent") or c.get("rentEstimate") or c.get("value")
         try:
             rent = float(r)
@@ -462,27 +575,28 @@ def persist_rentcast_comps_and_get_median(
     if replace_existing:
         db.execute(delete(RentComp).where(RentComp.property_id == property_id, RentComp.source == "rentcast"))
 
-    rents: list[float] = []
-    for c in normalized:
-        db.add(
-            RentComp(
-                property_id=property_id,
-                rent=float(c["rent"]),
-                source="rentcast",
-                address=c.get("address"),
-                url=c.get("url"),
-                bedrooms=int(c["bedrooms"]) if c.get("bedrooms") is not None else None,
-                bathrooms=float(c["bathrooms"]) if c.get("bathrooms") is not None else None,
-                square_feet=int(c["square_feet"]) if c.get("square_feet") is not None else None,
-                notes=c.get("notes"),
-            )
-        )
-        rents.append(float(c["rent"]))
+    # One executemany INSERT instead of an ORM instance and flush per comp;
+    # it runs in the same transaction as the delete above.
+    db.execute(
+        insert(RentComp),
+        [
+            {
+                "property_id": property_id,
+                "rent": c["rent"],
+                "source": "rentcast",
+                "address": c.get("address"),
+                "url": c.get("url"),
+                "bedrooms": int(c["bedrooms"]) if c.get("bedrooms") is not None else None,
+                "bathrooms": float(c["bathrooms"]) if c.get("bathrooms") is not None else None,
+                "square_feet": int(c["square_feet"]) if c.get("square_feet") is not None else None,
+                "notes": c.get("notes"),
+            }
+            for c in normalized
+        ],
+    )
 
-    try:
-        return float(statistics.median(rents)) if rents else None
-    except Exception:
-        return None
+    # "rent" is already a positive float from normalization above.
+    return float(statistics.median([c["rent"] for c in normalized]))
 
 
 __all__ = [
@@ -1,41 +1,99 @@
 # backend/app/workers/agent_tasks.py
 from __future__ import annotations
 
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timedelta
+import logging
 import os
 import random
+import threading
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, literal, or_, select, update
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.expression import ColumnElement
 
 from onehaven_platform.backend.src.config import settings
-from onehaven_platform.backend.src.db import SessionLocal
+from celery import group
+from celery.signals import worker_process_shutdown, worker_shutdown
+
+from onehaven_platform.backend.src.db import WorkerSessionLocal, autocommit_engine, engine
 from onehaven_platform.backend.src.models import AgentRun, AgentRunDeadletter
 from onehaven_platform.backend.src.services.agent_engine import execute_run_now, sweep_stuck_runs
 from onehaven_platform.backend.src.services.agent_orchestrator_runtime import on_run_terminal
 from onehaven_platform.backend.src.adapters.compliance_adapter import record_signal, recompute_and_persist
 from .celery_app import celery_app
 
-TERMINAL = {"done", "failed", "timed_out", "blocked"}
+TERMINAL: frozenset[str] = frozenset({"done", "failed", "timed_out", "blocked"})
+
+log = logging.getLogger("onehaven.agent_tasks")
+
+
+def _resolve_run_timeout_seconds() -> int:
+    timeout_s = int(getattr(settings, "agents_run_timeout_seconds", 120) or 120)
+    env_timeout = os.getenv("AGENTS_RUN_TIMEOUT_SECONDS")
+    if env_timeout:
+        try:
+            timeout_s = int(env_timeout)
+        except Exception:
+            pass
+    return timeout_s
+
+
+# Resolved once per worker process; the sweep runs on every beat tick.
+_RUN_TIMEOUT_SECONDS = _resolve_run_timeout_seconds()
+_MAX_RETRIES = int(getattr(settings, "agents_max_retries", 3) or 3)
+_RETRY_BASE_SECONDS = int(getattr(settings, "agents_retry_base_seconds", 5) or 5)
+_RETRY_CAP_SECONDS = int(getattr(settings, "agents_retry_max_seconds", 120) or 120)
+# Same switch the orchestrator honours; when off, no trust task is even queued.
+_TRUST_ENABLED = bool(getattr(settings, "agents_enable_trust_recompute", True))
+# Log the first trust failure and then every Nth, so an outage stays visible
+# without flooding the worker log.
+_TRUST_FAILURE_LOG_EVERY = 100
+_trust_failures = 0
+
+
+# Exception text can be huge (SQL echoes, LLM bodies); stored errors are capped.
+_ERROR_MAX_CHARS = 4096
+
+
+def _truncate(text: str, limit: int = _ERROR_MAX_CHARS) -> str:
+    if len(text) <= limit:
+        return text
+    return f"{text[:limit]}...[+{len(text) - limit} chars]"
 
 
 def _utcnow() -> datetime:
     return datetime.utcnow()
 
 
-def _backoff_seconds(retries: int) -> int:
-    base = int(getattr(settings, "agents_retry_base_seconds", 5) or 5)
-    cap = int(getattr(settings, "agents_retry_max_seconds", 120) or 120)
-    delay = min(cap, base * (2 ** max(0, int(retries))))
-    jitter = int(delay * 0.2)
-    if jitter > 0:
-        delay = max(1, delay + random.randint(-jitter, jitter))
-    return delay
+def _db_now(db):
+    """
+    Timestamp for worker writes. On Postgres the database clock is used
+    (now() at UTC, matching the naive-UTC DateTime columns), so no Python
+    datetime is built or shipped and worker clock skew does not matter.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return func.timezone("utc", func.now())
+    return _utcnow()
+
+
+def _backoff_seconds(prev_delay: int | None = None) -> int:
+    """
+    Decorrelated jitter: the next delay is drawn from [base, 3 * previous],
+    capped, so retries from a shared failure spread out instead of landing
+    together at fixed exponential steps.
+    """
+    base = _RETRY_BASE_SECONDS
+    prev = max(base, int(prev_delay or base))
+    return max(1, min(_RETRY_CAP_SECONDS, int(random.uniform(base, prev * 3))))
 
 
 def _emit_agent_trust(db, *, org_id: int, run: AgentRun) -> None:
     """
     Best-effort trust signal. Worker should not die because trust bookkeeping had a bad day.
     """
+    global _trust_failures
     try:
         status = (getattr(run, "status", None) or "").lower()
         ok = 1.0 if status == "done" else 0.0
@@ -56,65 +114,308 @@ def _emit_agent_trust(db, *, org_id: int, run: AgentRun) -> None:
             entity_type="agent",
             entity_id=str(getattr(run, "agent_key", "unknown")),
         )
+    except Exception:
+        _trust_failures += 1
+        if _trust_failures % _TRUST_FAILURE_LOG_EVERY == 1:
+            log.exception(
+                "agent trust emission failed (run_id=%s, failures=%s)",
+                getattr(run, "id", None),
+                _trust_failures,
+            )
+
+
+@celery_app.task(name="trust.emit_agent_run_signal", acks_late=True)
+def emit_agent_trust_task(org_id: int, run_id: int) -> dict:
+    """
+    Trust signal + score recompute for a finished run, off the agent queue
+    (routed by the "trust.*" rule in celery_app).
+    """
+    db = WorkerSessionLocal()
+    try:
+        run = db.scalar(
+            select(AgentRun).where(
+                AgentRun.id == int(run_id),
+                AgentRun.org_id == int(org_id),
+            )
+        )
+        if run is None:
+            return {"ok": False, "reason": "run_not_found"}
+        _emit_agent_trust(db, org_id=int(org_id), run=run)
+        db.commit()
+        return {"ok": True, "run_id": int(run_id), "status": run.status}
+    except Exception:
+        db.rollback()
+        return {"ok": False, "reason": "trust_emit_failed"}
+    finally:
+        db.close()
+
+
+def _dispatch_agent_trust(*, org_id: int, run_id: int) -> None:
+    if not _TRUST_ENABLED:
+        return
+    # Best-effort like _emit_agent_trust: a broker hiccup must not fail the run.
+    try:
+        emit_agent_trust_task.delay(int(org_id), int(run_id))
     except Exception:
         pass
 
 
+# Orchestrator/post-run deadletters are buffered and written in batches: they
+# arrive in bursts exactly when the database is already under pressure.
+_DEADLETTER_FLUSH_ROWS = 100
+_DEADLETTER_FLUSH_SECONDS = 0.2
+# After a failed write, wait longer before trying again.
+_DEADLETTER_RETRY_SECONDS = 5.0
+_deadletter_buffer: deque[dict] = deque(maxlen=10_000)
+_deadletter_lock = threading.Lock()
+_deadletter_timer: threading.Timer | None = None
+
+
+def _arm_deadletter_timer(delay: float) -> None:
+    """Schedule a flush unless one is pending. Caller holds _deadletter_lock."""
+    global _deadletter_timer
+    if _deadletter_timer is None:
+        _deadletter_timer = threading.Timer(delay, flush_deadletters)
+        _deadletter_timer.daemon = True
+        _deadletter_timer.start()
+
+
+def flush_deadletters() -> int:
+    """Write every buffered deadletter in one executemany INSERT."""
+    global _deadletter_timer
+    with _deadletter_lock:
+        rows = list(_deadletter_buffer)
+        _deadletter_buffer.clear()
+        _deadletter_timer = None
+    if not rows:
+        return 0
+    try:
+        with engine.begin() as conn:
+            conn.execute(insert(AgentRunDeadletter), rows)
+    except Exception:
+        log.exception("deadletter_flush_failed", extra={"rows": len(rows)})
+        # Keep them for the next flush; the bounded buffer drops the oldest.
+        with _deadletter_lock:
+            _deadletter_buffer.extendleft(reversed(rows))
+            _arm_deadletter_timer(_DEADLETTER_RETRY_SECONDS)
+        return 0
+    return len(rows)
+
+
 def _deadletter(
-    db,
     *,
     org_id: int,
     run_id: int,
     agent_key: str,
     reason: str,
     error: str,
+    exc_type: str | None = None,
 ) -> None:
-    try:
-        db.add(
-            AgentRunDeadletter(
-                org_id=int(org_id),
-                run_id=int(run_id),
-                agent_key=str(agent_key or "unknown"),
-                reason=str(reason),
-                error=str(error),
-                created_at=_utcnow(),
-            )
+    with _deadletter_lock:
+        _deadletter_buffer.append(
+            {
+                "org_id": int(org_id),
+                "run_id": int(run_id),
+                "agent_key": str(agent_key or "unknown"),
+                "reason": str(reason),
+                "error": _truncate(str(error)),
+                "exc_type": exc_type,
+                "created_at": _utcnow(),
+            }
+        )
+        flush_now = len(_deadletter_buffer) >= _DEADLETTER_FLUSH_ROWS
+        if not flush_now:
+            _arm_deadletter_timer(_DEADLETTER_FLUSH_SECONDS)
+    if flush_now:
+        flush_deadletters()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def _flush_deadletters_on_shutdown(**kwargs) -> None:
+    flush_deadletters()
+
+
+# Built once; callers bind run_id and org_id.
+_STMT_RUN_STATUS = select(AgentRun.status).where(
+    AgentRun.id == bindparam("run_id"),
+    AgentRun.org_id == bindparam("org_id"),
+)
+
+
+def _attached_run(db, run_id: int) -> AgentRun | None:
+    """The run execute_run_now left in this session, if any; never queries."""
+    return db.identity_map.get(identity_key(AgentRun, int(run_id)))
+
+
+def _mark_run_error(
+    db,
+    *,
+    org_id: int,
+    run_id: int,
+    attempt_number: int,
+    error: str,
+    final: bool,
+    deadletter_error: str | None = None,
+    exc_type: str | None = None,
+    run: AgentRun | None = None,
+) -> str | None:
+    """
+    Record a failed attempt with one UPDATE ... RETURNING (autocommitted on
+    its own connection for a retryable attempt). On the final retry
+    the run is also marked failed and its poison-run deadletter row is written
+    in the same transaction (a single UPDATE-in-CTE + INSERT on Postgres).
+    Only touches the run while it is still running under this attempt's
+    claim, so a run another worker has reclaimed or that already finished
+    is left alone. Returns the run's agent_key, or None when no run matched.
+    """
+    now = _db_now(db)
+    error = _truncate(error)
+    deadletter_error = _truncate(deadletter_error) if deadletter_error else error
+    values: dict[str, object] = {"last_error": error, "heartbeat_at": now}
+    if final:
+        values.update(status="failed", finished_at=now)
+        # Deadletter rows are stamped by the worker clock on every path,
+        # buffered or not, so they order consistently.
+        created_at = _utcnow()
+    else:
+        # Give up the claim's lease so the Celery retry can claim the run.
+        values.update(status="queued")
+
+    upd = (
+        update(AgentRun)
+        .where(
+            AgentRun.id == int(run_id),
+            AgentRun.org_id == int(org_id),
+            AgentRun.status == "running",
+            AgentRun.attempts == int(attempt_number),
         )
+        .values(**values)
+        .returning(AgentRun.agent_key)
+        .execution_options(synchronize_session=False)
+    )
+
+    if not final:
+        # Retryable attempt: just a progress write. One autocommitted
+        # statement, so no BEGIN/COMMIT round-trips and no lock held after.
+        with autocommit_engine.connect() as conn:
+            row = conn.execute(upd).first()
+    elif db.get_bind().dialect.name == "postgresql":
+        failed = upd.cte("failed_run")
+        row = db.execute(
+            insert(AgentRunDeadletter)
+            .from_select(
+                ["org_id", "run_id", "agent_key", "reason", "error", "exc_type", "created_at"],
+                select(
+                    literal(int(org_id)),
+                    literal(int(run_id)),
+                    func.coalesce(failed.c.agent_key, "unknown"),
+                    literal("poison_run_final_retry"),
+                    literal(deadletter_error),
+                    literal(exc_type),
+                    literal(created_at),
+                ),
+            )
+            .returning(AgentRunDeadletter.agent_key)
+        ).first()
+    else:
+        row = db.execute(upd).first()
+        if row is not None:
+            db.add(
+                AgentRunDeadletter(
+                    org_id=int(org_id),
+                    run_id=int(run_id),
+                    agent_key=str(row[0] or "unknown"),
+                    reason="poison_run_final_retry",
+                    error=deadletter_error,
+                    exc_type=exc_type,
+                    created_at=created_at,
+                )
+            )
+    if final:
         db.commit()
-    except Exception:
-        db.rollback()
+
+    if row is None:
+        return None
+    if run is not None:
+        # Keep the attached run in step without reloading it; columns set
+        # from the database clock are expired and load only if read.
+        for key, value in values.items():
+            if isinstance(value, ColumnElement):
+                db.expire(run, [key])
+            else:
+                set_committed_value(run, key, value)
+    return str(row[0] or "unknown")
 
 
 @celery_app.task(
     bind=True,
-    max_retries=3,
+    max_retries=_MAX_RETRIES,
     default_retry_delay=5,
+    acks_late=True,
+    reject_on_worker_lost=True,
     name="app.workers.agent_tasks.execute_agent_run",
 )
-def execute_agent_run(self, org_id: int, run_id: int) -> dict:
-    db = SessionLocal()
+def execute_agent_run(self, org_id: int, run_id: int, retry_delay_s: int | None = None) -> dict:
+    db = WorkerSessionLocal()
+    run_agent_key = "unknown"
+    # Set once this delivery holds the claim; until then a failure is not
+    # this attempt's to record.
+    attempt_number: int | None = None
     try:
-        run = db.scalar(
-            select(AgentRun).where(
-                AgentRun.id == int(run_id),
-                AgentRun.org_id == int(org_id),
-            )
-        )
-        if run is None:
+        run_where = (AgentRun.id == int(run_id), AgentRun.org_id == int(org_id))
+
+        # Replays of finished runs are common (at-least-once delivery); answer
+        # them from the status column alone, before loading the full row.
+        # AgentRun.status is normalized to lowercase on write.
+        current_status = db.execute(
+            _STMT_RUN_STATUS, {"run_id": int(run_id), "org_id": int(org_id)}
+        ).scalar_one_or_none()
+        if current_status is None:
             return {"ok": False, "reason": "run_not_found"}
-
-        current_status = (getattr(run, "status", None) or "").lower()
         if current_status in TERMINAL:
             return {"ok": True, "status": current_status, "idempotent": True}
 
-        attempt_number = int(getattr(run, "attempts", 0) or 0) + 1
-        try:
-            run.attempts = attempt_number
-            run.heartbeat_at = _utcnow()
-            db.add(run)
-            db.commit()
-        except Exception:
-            db.rollback()
+        # Claim the attempt in one statement. The claim takes a lease: it
+        # marks the run running with a fresh heartbeat, and a running run is
+        # only claimable again once that heartbeat is older than the run
+        # timeout. A duplicate or redelivered message arriving while another
+        # worker is executing the run (or waiting to lock it; SKIP LOCKED)
+        # therefore matches nothing. RETURNING hands back what the
+        # bookkeeping needs without a reload. A failed attempt hands the
+        # lease back (_mark_run_error); a run whose worker died is timed out
+        # by the sweeper or reclaimed once the lease lapses.
+        # (SQLite ignores FOR UPDATE, which is fine for single-worker dev.)
+        now = _db_now(db)
+        claimable = (
+            select(AgentRun.id)
+            .where(
+                *run_where,
+                AgentRun.status.notin_(TERMINAL),
+                or_(
+                    AgentRun.status != "running",
+                    AgentRun.heartbeat_at.is_(None),
+                    AgentRun.heartbeat_at < now - timedelta(seconds=_RUN_TIMEOUT_SECONDS),
+                ),
+            )
+            .with_for_update(skip_locked=True)
+        )
+        claimed = db.execute(
+            update(AgentRun)
+            .where(AgentRun.id.in_(claimable.scalar_subquery()))
+            .values(
+                status="running",
+                attempts=func.coalesce(AgentRun.attempts, 0) + 1,
+                heartbeat_at=now,
+            )
+            .returning(AgentRun.attempts, AgentRun.agent_key)
+            .execution_options(synchronize_session=False)
+        ).first()
+        db.commit()
+        if claimed is None:
+            return {"ok": True, "reason": "locked_elsewhere", "idempotent": True}
+        attempt_number = int(claimed[0])
+        run_agent_key = str(claimed[1] or "unknown")
 
         result = execute_run_now(
             db,
@@ -124,14 +425,10 @@ def execute_agent_run(self, org_id: int, run_id: int) -> dict:
         )
 
         try:
-            run2 = db.scalar(
-                select(AgentRun).where(
-                    AgentRun.id == int(run_id),
-                    AgentRun.org_id == int(org_id),
-                )
-            )
-            if run2 and (getattr(run2, "status", None) or "").lower() in TERMINAL:
-                _emit_agent_trust(db, org_id=int(org_id), run=run2)
+            # Every execute_run_now outcome reports the status it left the
+            # run in, so the terminal check needs no read-back.
+            if (result or {}).get("status") in TERMINAL:
+                _dispatch_agent_trust(org_id=int(org_id), run_id=int(run_id))
 
                 try:
                     on_run_terminal(db, org_id=int(org_id), run_id=int(run_id))
@@ -139,71 +436,53 @@ def execute_agent_run(self, org_id: int, run_id: int) -> dict:
                 except Exception as chain_err:
                     db.rollback()
                     _deadletter(
-                        db,
                         org_id=int(org_id),
                         run_id=int(run_id),
-                        agent_key=str(getattr(run2, "agent_key", "unknown")),
+                        agent_key=run_agent_key,
                         reason=f"orchestrator_runtime_error:{type(chain_err).__name__}",
                         error=str(chain_err),
+                        exc_type=type(chain_err).__name__,
                     )
         except Exception as post_err:
             db.rollback()
             _deadletter(
-                db,
                 org_id=int(org_id),
                 run_id=int(run_id),
-                agent_key=str(getattr(run, "agent_key", "unknown")),
+                agent_key=run_agent_key,
                 reason=f"post_run_error:{type(post_err).__name__}",
                 error=str(post_err),
+                exc_type=type(post_err).__name__,
             )
 
         return {"ok": True, "result": result, "attempt": attempt_number}
 
     except Exception as e:
+        retries = int(getattr(self.request, "retries", 0) or 0)
+        is_final = retries >= (_MAX_RETRIES - 1)
+
+        agent_key: str | None = None
         try:
-            run2 = db.scalar(
-                select(AgentRun).where(
-                    AgentRun.id == int(run_id),
-                    AgentRun.org_id == int(org_id),
+            # Drop whatever the failed attempt left pending before recording it.
+            db.rollback()
+            if attempt_number is not None:
+                agent_key = _mark_run_error(
+                    db,
+                    org_id=int(org_id),
+                    run_id=int(run_id),
+                    attempt_number=attempt_number,
+                    error=f"{type(e).__name__}: {e}",
+                    final=is_final,
+                    deadletter_error=str(e),
+                    exc_type=type(e).__name__,
+                    run=_attached_run(db, run_id),
                 )
-            )
-            if run2:
-                run2.last_error = f"{type(e).__name__}: {e}"
-                run2.heartbeat_at = _utcnow()
-                db.add(run2)
-                db.commit()
         except Exception:
             db.rollback()
 
-        retries = int(getattr(self.request, "retries", 0) or 0)
-        max_retries = int(getattr(self, "max_retries", 3) or 3)
-        is_final = retries >= (max_retries - 1)
-
         if is_final:
-            try:
-                run3 = db.scalar(
-                    select(AgentRun).where(
-                        AgentRun.id == int(run_id),
-                        AgentRun.org_id == int(org_id),
-                    )
-                )
-                if run3:
-                    run3.status = "failed"
-                    run3.finished_at = _utcnow()
-                    run3.last_error = f"{type(e).__name__}: {e}"
-                    db.add(run3)
-                    db.commit()
-
-                    _deadletter(
-                        db,
-                        org_id=int(org_id),
-                        run_id=int(run_id),
-                        agent_key=str(getattr(run3, "agent_key", "unknown")),
-                        reason="poison_run_final_retry",
-                        error=str(e),
-                    )
-
-                    _emit_agent_trust(db, org_id=int(org_id), run=run3)
+            if agent_key is not None:
+                try:
+                    _dispatch_agent_trust(org_id=int(org_id), run_id=int(run_id))
 
                     try:
                         on_run_terminal(db, org_id=int(org_id), run_id=int(run_id))
@@ -211,45 +490,58 @@ def execute_agent_run(self, org_id: int, run_id: int) -> dict:
                     except Exception as chain_err:
                         db.rollback()
                         _deadletter(
-                            db,
                             org_id=int(org_id),
                             run_id=int(run_id),
-                            agent_key=str(getattr(run3, "agent_key", "unknown")),
+                            agent_key=agent_key,
                             reason=f"final_orchestrator_runtime_error:{type(chain_err).__name__}",
                             error=str(chain_err),
+                            exc_type=type(chain_err).__name__,
                         )
-            except Exception:
-                db.rollback()
+                except Exception:
+                    db.rollback()
 
             return {
                 "ok": False,
                 "reason": "failed_final",
-                "error": str(e),
+                "error": _truncate(str(e)),
                 "retries": retries,
             }
 
-        delay = _backoff_seconds(retries=retries)
-        raise self.retry(exc=e, countdown=delay)
+        delay = _backoff_seconds(retry_delay_s)
+        # The delay rides along in the retried task's kwargs to seed the next draw.
+        raise self.retry(
+            exc=e,
+            countdown=delay,
+            kwargs={**(self.request.kwargs or {}), "retry_delay_s": delay},
+        )
 
     finally:
         db.close()
 
 
+def dispatch_agent_runs(*, org_id: int, run_ids: list[int]) -> None:
+    """
+    Enqueue several independent runs at once: a group is published over one
+    producer connection instead of one broker round-trip per run. Routing
+    (task_routes) still applies to every member.
+    """
+    if not run_ids:
+        return
+    if len(run_ids) == 1:
+        execute_agent_run.delay(org_id=int(org_id), run_id=int(run_ids[0]))
+        return
+    group(
+        execute_agent_run.s(org_id=int(org_id), run_id=int(rid)) for rid in run_ids
+    ).apply_async()
+
+
 @celery_app.task(name="app.workers.agent_tasks.sweep_stuck_agent_runs")
 def sweep_stuck_agent_runs() -> dict:
-    db = SessionLocal()
+    db = WorkerSessionLocal()
     try:
-        timeout_s = int(getattr(settings, "agents_run_timeout_seconds", 120) or 120)
-        env_timeout = os.getenv("AGENTS_RUN_TIMEOUT_SECONDS")
-        if env_timeout:
-            try:
-                timeout_s = int(env_timeout)
-            except Exception:
-                pass
-
         res = sweep_stuck_runs(
             db,
-            timeout_seconds=timeout_s,
+            timeout_seconds=_RUN_TIMEOUT_SECONDS,
             queued_max_hours=12,
         )
         return {"ok": True, "sweep": res}
@@ -1,10 +1,17 @@
 # backend/app/workers/agent_worker.py
 from __future__ import annotations
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue as queue_mod
+
 from celery import Celery
+from celery.signals import worker_process_init
 from sqlalchemy import select
 
-from onehaven_platform.backend.src.db import SessionLocal
+from onehaven_platform.backend.src.db import SessionLocal, engine
 from onehaven_platform.backend.src.models import AgentRun
 from onehaven_platform.backend.src.services.agent_engine import execute_run_now
 from onehaven_platform.backend.src.config import settings
@@ -13,6 +20,8 @@ broker = getattr(settings, "celery_broker_url", None) or "redis://redis:6379/0"
 backend = getattr(settings, "celery_result_backend", None) or "redis://redis:6379/1"
 queue = getattr(settings, "celery_queue", None) or "celery"
 
+log = logging.getLogger("onehaven.agent_worker")
+
 celery_app = Celery(
     "onehaven_agents",
     broker=broker,
@@ -23,8 +32,10 @@ celery_app.conf.update(
     task_serializer="json",
     accept_content=["json"],
     result_serializer="json",
+    # As in jobs/celery_app: only results are large enough to be worth gzip.
+    result_compression="gzip",
     task_acks_late=True,
-    worker_prefetch_multiplier=1,
+    worker_prefetch_multiplier=int(getattr(settings, "celery_prefetch_multiplier", 2) or 2),
     broker_connection_retry_on_startup=True,
     task_time_limit=int(getattr(settings, "agents_run_timeout_seconds", 120) or 120),
     timezone="UTC",
@@ -48,33 +59,100 @@ celery_app.conf.update(
 )
 
 
-def main(limit: int = 50) -> None:
+@worker_process_init.connect
+def _worker_process_init(**kwargs):
+    # Same as jobs/celery_app: a forked child drops the parent's pooled
+    # connections without closing them and builds its own pool once.
+    engine.dispose(close=False)
+
+
+# Built once; every claim in every drain thread reuses it.
+_STMT_NEXT_QUEUED = (
+    select(AgentRun)
+    .where(AgentRun.status == "queued")
+    .order_by(AgentRun.id.asc())
+    .limit(1)
+    .with_for_update(skip_locked=True)
+)
+
+
+def _drain(budget: Iterator[int]) -> None:
     """
-    Manual worker (CLI):
-    - Useful in dev if you don't want celery running
-    - Still respects idempotency + contract enforcement via execute_run_now
+    Claim and execute queued runs in this thread's own session (sessions are
+    not thread-safe) until the shared budget or the queue runs out.
     """
     db = SessionLocal()
     try:
-        runs = db.scalars(
-            select(AgentRun)
-            .where(AgentRun.status == "queued")
-            .order_by(AgentRun.id.asc())
-            .limit(limit)
-        ).all()
-
-        for r in runs:
+        for _ in budget:
+            # Claim one queued run at a time. SKIP LOCKED lets concurrent
+            # drains (or Celery workers) pass over it, and execute_run_now's
+            # commit of the "running" transition releases it already claimed.
+            r = db.scalar(_STMT_NEXT_QUEUED)
+            if r is None:
+                break
+
+            # id/org_id/attempts are Integer columns; no casts needed.
             out = execute_run_now(
                 db,
-                org_id=int(r.org_id),
-                run_id=int(r.id),
-                attempt_number=int((r.attempts or 0) + 1),
+                org_id=r.org_id,
+                run_id=r.id,
+                attempt_number=(r.attempts or 0) + 1,
+            )
+            log.info(
+                "[agent_worker] run_id=%s status=%s ok=%s",
+                r.id,
+                out.get("status"),
+                out.get("ok"),
+                extra={"run_id": r.id, "status": out.get("status"), "ok": out.get("ok")},
             )
-            print(f"[agent_worker] run_id={r.id} status={out.get('status')} ok={out.get('ok')}")
     finally:
         db.close()
 
 
+def main(limit: int = 50, concurrency: int | None = None) -> None:
+    """
+    Manual worker (CLI):
+    - Useful in dev if you don't want celery running
+    - Still respects idempotency + contract enforcement via execute_run_now
+    - Runs are I/O-bound, so `concurrency` threads drain the queue side by side
+    """
+    workers = max(
+        1,
+        int(concurrency or getattr(settings, "agents_cli_worker_concurrency", 4) or 4),
+    )
+    if engine.dialect.name == "sqlite":
+        # SQLite ignores FOR UPDATE SKIP LOCKED, so parallel drains would
+        # claim the same queued run.
+        workers = 1
+    # One iterator shared by every thread: each run taken costs one token.
+    budget = iter(range(max(0, int(limit))))
+
+    # Drain threads only enqueue log records; one listener thread writes them
+    # to stderr, so terminal I/O never stalls a run.
+    records: queue_mod.SimpleQueue = queue_mod.SimpleQueue()
+    handler = QueueHandler(records)
+    listener = QueueListener(records, logging.StreamHandler())
+    propagate = log.propagate
+    level = log.level
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener.start()
+    try:
+        if workers == 1:
+            _drain(budget)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="agent_worker") as pool:
+            for fut in [pool.submit(_drain, budget) for _ in range(workers)]:
+                fut.result()
+    finally:
+        log.removeHandler(handler)
+        log.propagate = propagate
+        log.setLevel(level)
+        listener.stop()
+
+
 __all__ = ["celery_app", "main"]
 
 
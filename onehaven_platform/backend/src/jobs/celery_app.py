@@ -24,6 +24,12 @@ from onehaven_platform.backend.src.config import settings
 broker = getattr(settings, "celery_broker_url", None) or "redis://redis:6379/0"
 backend = getattr(settings, "celery_result_backend", None) or "redis://redis:6379/1"
 queue = getattr(settings, "celery_queue", None) or "celery"
+# Trust bookkeeping can run on its own workers; unset, it shares the main queue.
+trust_queue = getattr(settings, "celery_trust_queue", None) or queue
+# Agent runs (up to the run timeout) and the cheap stuck-run sweep can be split
+# so a long run never sits in front of a sweep; unset, both use the main queue.
+agents_long_queue = getattr(settings, "celery_agents_long_queue", None) or queue
+agents_fast_queue = getattr(settings, "celery_agents_fast_queue", None) or queue
 
 worker_log = logging.getLogger("onehaven.worker")
 task_log = logging.getLogger("onehaven.task")
@@ -158,23 +164,60 @@ celery_app.conf.update(
     task_serializer="json",
     accept_content=["json"],
     result_serializer="json",
+    # Task args are a couple of ids (compression would only grow them), but
+    # results carry agent outputs and ingestion summaries into Redis.
+    result_compression="gzip",
     timezone="UTC",
     enable_utc=True,
+    # Agent/ingestion tasks mostly wait on the DB and LLMs: ack after the run
+    # (a killed worker's task is redelivered; the agent task's claim lease
+    # and terminal check turn replays of a live or finished run into no-ops).
+    # A prefetch of 2 overlaps the next fetch with the current task's I/O
+    # without letting a slow worker sit on a deep backlog an idle one could
+    # take.
     task_acks_late=True,
     task_acks_on_failure_or_timeout=False,
     task_reject_on_worker_lost=True,
-    worker_prefetch_multiplier=1,
+    worker_prefetch_multiplier=int(getattr(settings, "celery_prefetch_multiplier", 2) or 2),
+    # With late acks Redis redelivers anything unacked past this window, so it
+    # must exceed the longest task runtime plus the largest retry countdown.
+    broker_transport_options={
+        "visibility_timeout": int(
+            getattr(settings, "celery_visibility_timeout_seconds", 3600) or 3600
+        ),
+        # Keep idle pooled broker sockets alive and probe them, rather than
+        # finding a dead one (and reconnecting) on the next publish.
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
+    broker_pool_limit=10,
+    redis_socket_keepalive=True,
+    redis_max_connections=20,
     broker_connection_retry_on_startup=True,
     task_time_limit=int(getattr(settings, "agents_run_timeout_seconds", 180) or 180),
     task_soft_time_limit=int(getattr(settings, "agents_run_timeout_seconds", 180) or 180),
     worker_max_tasks_per_child=int(
         getattr(settings, "celery_worker_max_tasks_per_child", 200) or 200
     ),
+    # Agent work is I/O-bound, so "threads" with a high concurrency packs many
+    # runs into one process (size db_pool_size to match). gevent/eventlet need
+    # their package installed and must be chosen with `-P` so Celery can
+    # monkey-patch before imports; this setting alone does not patch.
+    worker_pool=str(getattr(settings, "celery_worker_pool", None) or "prefork"),
+    worker_concurrency=getattr(settings, "celery_worker_concurrency", None),
     worker_send_task_events=True,
     task_send_sent_event=True,
     task_default_queue=queue,
     task_default_routing_key=queue,
     task_routes={
+        "app.workers.agent_tasks.execute_agent_run": {
+            "queue": agents_long_queue,
+            "routing_key": agents_long_queue,
+        },
+        "app.workers.agent_tasks.sweep_stuck_agent_runs": {
+            "queue": agents_fast_queue,
+            "routing_key": agents_fast_queue,
+        },
         "ingestion.*": {"queue": queue, "routing_key": queue},
         "location.*": {"queue": queue, "routing_key": queue},
         "jurisdiction.*": {"queue": queue, "routing_key": queue},
@@ -182,6 +225,7 @@ celery_app.conf.update(
         "agent.*": {"queue": queue, "routing_key": queue},
         "market_sync.*": {"queue": queue, "routing_key": queue},
         "rent.*": {"queue": queue, "routing_key": queue},
+        "trust.*": {"queue": trust_queue, "routing_key": trust_queue},
     },
     task_always_eager=bool(getattr(settings, "celery_task_always_eager", False)),
     task_eager_propagates=bool(getattr(settings, "celery_task_eager_propagates", True)),
@@ -201,6 +245,12 @@ celery_app.conf.update(
 
 @worker_process_init.connect
 def _worker_process_init(**kwargs):
+    # Connections inherited from the prefork parent must not be shared with
+    # it; drop them without closing so this child builds its own pool once.
+    from onehaven_platform.backend.src.db import engine
+
+    engine.dispose(close=False)
+
     _emit(
         worker_log,
         {
@@ -18,8 +18,9 @@ from sqlalchemy import (
     JSON,
     Index,
     BigInteger,
+    text,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from onehaven_platform.backend.src.db import Base
 
@@ -445,6 +446,7 @@ class Deal(Base):
         UniqueConstraint("org_id", "source_fingerprint", name="uq_deals_org_source_fingerprint"),
         Index("ix_deals_org_property", "org_id", "property_id"),
         Index("ix_deals_org_created_at", "org_id", "created_at"),
+        Index("ix_deals_org_property_updated_at", "org_id", "property_id", "updated_at", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -767,6 +769,9 @@ class JurisdictionRule(Base):
 
 class UnderwritingResult(Base):
     __tablename__ = "underwriting_results"
+    __table_args__ = (
+        Index("ix_underwriting_results_deal_created_at", "deal_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     org_id: Mapped[int] = mapped_column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
@@ -831,6 +836,7 @@ class Inspection(Base):
         Index("ix_inspections_result_status", "result_status"),
         Index("ix_inspections_readiness_status", "readiness_status"),
         Index("ix_inspections_property_template_version", "property_id", "template_version"),
+        Index("ix_inspections_org_property_date", "org_id", "property_id", "inspection_date", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -885,6 +891,11 @@ class InspectionItem(Base):
         Index("ix_inspection_items_inspection_result_status", "inspection_id", "result_status"),
         Index("ix_inspection_items_category", "category"),
         Index("ix_inspection_items_requires_reinspection", "requires_reinspection"),
+        Index(
+            "ix_inspection_items_open_failed",
+            "inspection_id",
+            postgresql_where=text("failed = true AND resolved_at IS NULL"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -1270,6 +1281,9 @@ class Lease(Base):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        Index("ix_transactions_org_property_id", "org_id", "property_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     org_id: Mapped[int] = mapped_column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
@@ -1290,6 +1304,9 @@ class Transaction(Base):
 
 class Valuation(Base):
     __tablename__ = "valuations"
+    __table_args__ = (
+        Index("ix_valuations_org_property_id", "org_id", "property_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     org_id: Mapped[int] = mapped_column(Integer, ForeignKey("organizations.id"), nullable=False, index=True)
@@ -1336,6 +1353,11 @@ class AgentRun(Base):
     __table_args__ = (
         UniqueConstraint("org_id", "idempotency_key", name="uq_agent_runs_org_idempotency_key"),
         Index("ix_agent_runs_org_property_id_id", "org_id", "property_id", "id"),
+        Index(
+            "ix_agent_runs_sweepable",
+            "id",
+            postgresql_where=text("status IN ('queued', 'running')"),
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -1366,6 +1388,11 @@ class AgentRun(Base):
 
     proposed_actions_json: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
+    @validates("status")
+    def _normalize_status(self, _key: str, value: Optional[str]) -> Optional[str]:
+        # Stored lowercase so status checks can compare without .lower().
+        return value.strip().lower() if isinstance(value, str) else value
+
 
 class AgentMessage(Base):
     __tablename__ = "agent_messages"
@@ -1551,6 +1578,15 @@ class OrgSubscription(Base):
 
 class UsageLedger(Base):
     __tablename__ = "usage_ledger"
+    __table_args__ = (
+        Index(
+            "ix_usage_ledger_org_metric_created_at",
+            "org_id",
+            "metric",
+            "created_at",
+            postgresql_include=["units"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     org_id: Mapped[int] = mapped_column(Integer, nullable=False)
@@ -1630,6 +1666,7 @@ class AgentRunDeadletter(Base):
     agent_key: Mapped[str] = mapped_column(String(80), nullable=False)
     reason: Mapped[str] = mapped_column(String(120), nullable=False)
     error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    exc_type: Mapped[str | None] = mapped_column(String(120), nullable=True, index=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
 
 class TaxLookupResult:
@@ -1,19 +1,19 @@
 # onehaven_decision_engine/backend/app/domain/audit.py
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from typing import Any, Optional
 
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.models import AuditEvent
+from onehaven_platform.backend.src.shared_kernel import json_codec
 
 
 def _dumps(v: Optional[dict[str, Any]]) -> Optional[str]:
     if v is None:
         return None
-    return json.dumps(v, sort_keys=True, default=str)
+    return json_codec.dumps(v, sort_keys=True, default=str)
 
 
 def audit_write(
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import threading
 import time
+import weakref
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Iterator
@@ -65,18 +66,55 @@ class _Metrics:
     - gauges: latest numeric value
     - timings: aggregated duration stats (count/total/avg/min/max)
     - labeled metrics via metric name expansion
+
+    Counters are sharded per thread: each thread only ever writes its own
+    dict, so inc() takes no lock, and readers merge the shards. Shards are
+    keyed by a weak reference to their thread; once a thread has exited its
+    counts are folded into _retired_counters and the shard is dropped.
     """
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
-        self._counters: dict[str, int] = {}
+        self._local = threading.local()
+        self._counter_shards: dict[weakref.ref[threading.Thread], dict[str, int]] = {}
+        self._retired_counters: dict[str, int] = {}
         self._gauges: dict[str, float] = {}
         self._timers: dict[str, _TimerStat] = {}
 
+    def _counter_shard(self) -> dict[str, int]:
+        local = self._local
+        shard = getattr(local, "counters", None)
+        if shard is None:
+            shard = {}
+            with self._lock:
+                self._prune_counter_shards()
+                self._counter_shards[weakref.ref(threading.current_thread())] = shard
+            local.counters = shard
+        return shard
+
+    def _prune_counter_shards(self) -> None:
+        """Fold the shards of exited threads into _retired_counters. Caller holds _lock."""
+        for ref, shard in list(self._counter_shards.items()):
+            thread = ref()
+            if thread is not None and thread.is_alive():
+                continue
+            for key, value in shard.items():
+                self._retired_counters[key] = self._retired_counters.get(key, 0) + value
+            del self._counter_shards[ref]
+
+    def _merged_counters(self) -> dict[str, int]:
+        merged = dict(self._retired_counters)
+        for shard in self._counter_shards.values():
+            # dict.copy() runs under the GIL, so it never sees a half-applied
+            # write from the owning thread.
+            for key, value in shard.copy().items():
+                merged[key] = merged.get(key, 0) + value
+        return merged
+
     def inc(self, name: str, n: int = 1, *, labels: dict[str, Any] | None = None) -> None:
         key = _metric_key(name, labels)
-        with self._lock:
-            self._counters[key] = int(self._counters.get(key, 0)) + int(n)
+        shard = self._counter_shard()
+        shard[key] = shard.get(key, 0) + int(n)
 
     def set_gauge(self, name: str, value: float | int, *, labels: dict[str, Any] | None = None) -> None:
         key = _metric_key(name, labels)
@@ -114,7 +152,9 @@ class _Metrics:
     def get_counter(self, name: str, *, labels: dict[str, Any] | None = None) -> int:
         key = _metric_key(name, labels)
         with self._lock:
-            return int(self._counters.get(key, 0))
+            return int(self._retired_counters.get(key, 0)) + sum(
+                int(shard.get(key, 0)) for shard in self._counter_shards.values()
+            )
 
     def get_gauge(self, name: str, *, labels: dict[str, Any] | None = None) -> float | None:
         key = _metric_key(name, labels)
@@ -130,14 +170,20 @@ class _Metrics:
 
     def reset(self) -> None:
         with self._lock:
-            self._counters.clear()
+            # Swap in fresh containers instead of clearing dicts other threads
+            # may be writing; every thread registers a new shard on its next
+            # inc().
+            self._local = threading.local()
+            self._counter_shards = {}
+            self._retired_counters = {}
             self._gauges.clear()
             self._timers.clear()
 
     def snapshot(self) -> dict[str, Any]:
         with self._lock:
+            self._prune_counter_shards()
             return {
-                "counters": dict(self._counters),
+                "counters": self._merged_counters(),
                 "gauges": {k: round(float(v), 2) for k, v in self._gauges.items()},
                 "timers": {k: v.snapshot() for k, v in self._timers.items()},
             }
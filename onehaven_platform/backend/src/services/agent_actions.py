@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Optional
@@ -13,20 +12,21 @@ from onehaven_platform.backend.src.domain.agents.contracts import get_contract,
 from onehaven_platform.backend.src.models import AgentRun, WorkflowEvent, RehabTask, PropertyChecklistItem
 from onehaven_platform.backend.src.services.agent_trace import emit_trace_safe
 from onehaven_platform.backend.src.services.state_machine_service import sync_property_state
+from onehaven_platform.backend.src.shared_kernel import json_codec
 
 
 def _loads(s: Optional[str], default: Any) -> Any:
     if not s:
         return default
     try:
-        return json.loads(s)
+        return json_codec.loads(s)
     except Exception:
         return default
 
 
 def _dumps(v: Any) -> str:
     try:
-        return json.dumps(v)
+        return json_codec.dumps(v)
     except Exception:
         return "{}"
 
@@ -78,7 +78,7 @@ def apply_run_actions(
         )
 
         if r.property_id:
-            sync_property_state(db, org_id=org_id, property_id=int(r.property_id))
+            sync_property_state(db, org_id=org_id, property_id=int(r.property_id), flush=False)
 
         emit_trace_safe(
             db,
@@ -196,7 +196,7 @@ def apply_run_actions(
     )
 
     if r.property_id:
-        sync_property_state(db, org_id=org_id, property_id=int(r.property_id))
+        sync_property_state(db, org_id=org_id, property_id=int(r.property_id), flush=False)
 
     emit_trace_safe(
         db,
@@ -1,7 +1,6 @@
 # backend/app/services/agent_engine.py
 from __future__ import annotations
 
-import json
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
@@ -15,16 +14,18 @@ from onehaven_platform.backend.src.domain.agents.executor import execute_agent
 from onehaven_platform.backend.src.models import AgentRun, WorkflowEvent
 from onehaven_platform.backend.src.services.agent_actions import apply_run_actions
 from onehaven_platform.backend.src.services.agent_trace import emit_trace_safe
+from onehaven_platform.backend.src.shared_kernel import json_codec
 
 TERMINAL = {"done", "failed", "timed_out"}
 ACTIVE = {"queued", "running", "blocked"}
 RUN_STATUSES = {"queued", "running", "done", "failed", "blocked", "timed_out"}
+SWEEPABLE = ("queued", "running")
 APPROVAL_STATUSES = {"not_required", "pending", "approved", "rejected"}
 
 
 def _dumps(v: Any) -> str:
     try:
-        return json.dumps(v)
+        return json_codec.dumps(v)
     except Exception:
         return "{}"
 
@@ -33,7 +34,7 @@ def _loads(s: Optional[str], default: Any) -> Any:
     if not s:
         return default
     try:
-        return json.loads(s)
+        return json_codec.loads(s)
     except Exception:
         return default
 
@@ -769,8 +770,13 @@ def sweep_stuck_runs(
     changed = 0
     details: list[dict[str, Any]] = []
 
+    # Only queued/running rows can be swept; this predicate matches the
+    # partial index ix_agent_runs_sweepable, so the scan tracks live runs.
     rows = db.scalars(
-        select(AgentRun).order_by(AgentRun.id.desc()).limit(500)
+        select(AgentRun)
+        .where(AgentRun.status.in_(SWEEPABLE))
+        .order_by(AgentRun.id.desc())
+        .limit(500)
     ).all()
 
     for run in rows:
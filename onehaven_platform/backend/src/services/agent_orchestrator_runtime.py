@@ -59,6 +59,7 @@ def on_run_terminal(db: Session, *, org_id: int, run_id: int) -> None:
         return
 
     created_ids: list[int] = []
+    queued_ids: list[int] = []
 
     for p in planned:
         created = create_run(
@@ -90,9 +91,12 @@ def on_run_terminal(db: Session, *, org_id: int, run_id: int) -> None:
         )
 
         if (getattr(created, "status", "") or "").lower() == "queued":
-            from onehaven_platform.backend.src.jobs.agent_tasks import execute_agent_run
+            queued_ids.append(int(created.id))
 
-            execute_agent_run.delay(org_id=int(org_id), run_id=int(created.id))
+    if queued_ids:
+        from onehaven_platform.backend.src.jobs.agent_tasks import dispatch_agent_runs
+
+        dispatch_agent_runs(org_id=int(org_id), run_ids=queued_ids)
 
     emit_trace_safe(
         db,
@@ -1,16 +1,21 @@
 # backend/app/services/plan_service.py
 from __future__ import annotations
 
-import json
+import logging
+import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import and_, bindparam, case, func, or_, select
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.models import ApiKey, Plan, Property, UsageLedger
+from onehaven_platform.backend.src.shared_kernel import json_codec
+
+log = logging.getLogger("onehaven.plan_service")
 
 try:
     from onehaven_platform.backend.src.models import Subscription as OrgSubscription  # type: ignore
@@ -107,15 +112,19 @@ def _now() -> datetime:
 def _loads_json(raw: str | None) -> dict[str, Any]:
     if not raw:
         return {}
+    if isinstance(raw, dict):
+        return dict(raw)
     try:
-        value = json.loads(raw)
-        return dict(value) if isinstance(value, dict) else {}
-    except Exception:
+        value = json_codec.loads(raw)
+    except ValueError:
+        # Parsed plan payloads are memoized per text, so a corrupt row logs once.
+        log.warning("plan_limits_json_invalid", extra={"raw_prefix": str(raw)[:80]})
         return {}
+    return dict(value) if isinstance(value, dict) else {}
 
 
 def _dumps_json(value: dict[str, Any]) -> str:
-    return json.dumps(value, separators=(",", ":"), sort_keys=True)
+    return json_codec.dumps(value, sort_keys=True)
 
 
 def _normalize_plan_payload(payload: dict[str, Any]) -> dict[str, Any]:
@@ -142,6 +151,12 @@ def _normalize_plan_payload(payload: dict[str, Any]) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=32)
+def _parse_plan_payload(limits_json: str | None) -> dict[str, Any]:
+    # Keyed on the raw column text, so an edited plan simply misses the cache.
+    return _normalize_plan_payload(_loads_json(limits_json))
+
+
 def ensure_default_plans(db: Session) -> None:
     existing = {str(p.code) for p in db.scalars(select(Plan)).all()}
     changed = False
@@ -164,39 +179,107 @@ def ensure_default_plans(db: Session) -> None:
 
     if changed:
         db.commit()
+        invalidate_plan_limits()
+
+
+# Per-process cache of each org's plan code and parsed plan payload. Plans
+# change rarely, so a short TTL bounds staleness across workers while the
+# explicit invalidation below covers changes made in this process.
+_PLAN_CACHE_TTL_SECONDS = 60.0
+_plan_cache: dict[tuple[str, int], tuple[float, Any]] = {}
+
+
+def invalidate_plan_limits(org_id: int | None = None) -> None:
+    """Drop cached plan data for one org, or for every org when org_id is None."""
+    if org_id is None:
+        _plan_cache.clear()
+        return
+    for kind in ("code", "payload"):
+        _plan_cache.pop((kind, int(org_id)), None)
+
+
+def _cached_plan_value(kind: str, org_id: int, load: Any) -> Any:
+    key = (kind, int(org_id))
+    now = time.monotonic()
+    hit = _plan_cache.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    value = load()
+    _plan_cache[key] = (now + _PLAN_CACHE_TTL_SECONDS, value)
+    return value
+
+
+_ACTIVE_SUBSCRIPTION_STATUSES = ("active", "trialing", "trial")
+
+
+def _subscription_is_active(status: Any) -> bool:
+    return str(status or "active").lower() in _ACTIVE_SUBSCRIPTION_STATUSES
+
+
+# Built once; callers bind org_id.
+_STMT_SUB_LATEST = select(OrgSubscription).where(OrgSubscription.org_id == bindparam("org_id"))
+if hasattr(OrgSubscription, "id"):
+    _STMT_SUB_LATEST = _STMT_SUB_LATEST.order_by(OrgSubscription.id.desc())
+
+# Limits come from the same row get_plan_code reads: the org's latest
+# subscription, and only while that row is active. NULL and "" statuses
+# count as active, like _subscription_is_active.
+_SUBSCRIPTION_JOIN = [
+    OrgSubscription.org_id == bindparam("org_id"),
+    func.lower(func.trim(OrgSubscription.plan_code)) == Plan.code,
+    func.lower(func.coalesce(func.nullif(OrgSubscription.status, ""), "active")).in_(_ACTIVE_SUBSCRIPTION_STATUSES),
+]
+if hasattr(OrgSubscription, "id"):
+    _latest_sub = OrgSubscription.__table__.alias("latest_sub")
+    _SUBSCRIPTION_JOIN.append(
+        OrgSubscription.id
+        == select(func.max(_latest_sub.c.id)).where(_latest_sub.c.org_id == bindparam("org_id")).scalar_subquery()
+    )
+
+_HAS_SUBSCRIPTION = OrgSubscription.org_id.is_not(None)
+_STMT_PLAN_LIMITS_JSON = (
+    select(Plan.limits_json)
+    .select_from(Plan)
+    .outerjoin(OrgSubscription, and_(*_SUBSCRIPTION_JOIN))
+    .where(or_(_HAS_SUBSCRIPTION, Plan.code == "free"))
+    .order_by(case((_HAS_SUBSCRIPTION, 0), else_=1))
+    .limit(1)
+)
 
 
 def _get_active_subscription(db: Session, *, org_id: int) -> Any | None:
-    stmt = select(OrgSubscription).where(OrgSubscription.org_id == int(org_id))
-    if hasattr(OrgSubscription, "id"):
-        stmt = stmt.order_by(OrgSubscription.id.desc())
-    row = db.scalar(stmt)
+    row = db.scalar(_STMT_SUB_LATEST, {"org_id": int(org_id)})
     if row is None:
         return None
 
-    status = str(getattr(row, "status", "active") or "active").lower()
-    if status not in {"active", "trialing", "trial"}:
+    if not _subscription_is_active(getattr(row, "status", "active")):
         return None
     return row
 
 
 def get_plan_code(db: Session, *, org_id: int) -> str:
-    ensure_default_plans(db)
+    return _cached_plan_value("code", org_id, lambda: _load_plan_code(db, org_id=int(org_id)))
+
+
+def _load_plan_code(db: Session, *, org_id: int) -> str:
     sub = _get_active_subscription(db, org_id=int(org_id))
     plan_code = str(getattr(sub, "plan_code", "") or "").strip().lower()
     return plan_code or "free"
 
 
 def get_plan_payload(db: Session, *, org_id: int) -> dict[str, Any]:
-    ensure_default_plans(db)
+    payload = _cached_plan_value("payload", org_id, lambda: _load_plan_payload(db, org_id=int(org_id)))
+    return {key: dict(value) for key, value in payload.items()}
 
-    plan_code = get_plan_code(db, org_id=int(org_id))
-    plan = db.scalar(select(Plan).where(Plan.code == str(plan_code)))
-    if not plan:
-        plan = db.scalar(select(Plan).where(Plan.code == "free"))
 
-    payload = _normalize_plan_payload(_loads_json(getattr(plan, "limits_json", None)))
-    return payload
+def _load_plan_payload(db: Session, *, org_id: int) -> dict[str, Any]:
+    # Default plans are seeded once at app startup, so a miss is one query:
+    # the org's active plan if it has one, otherwise the free plan.
+    limits_json = db.scalar(_STMT_PLAN_LIMITS_JSON, {"org_id": int(org_id)})
+    if limits_json is None:
+        limits_json = _dumps_json(DEFAULT_PLANS["free"])
+
+    return _parse_plan_payload(limits_json)
 
 
 def get_limits(db: Session, *, org_id: int) -> dict[str, Any]:
@@ -272,6 +355,25 @@ def assert_feature_enabled(db: Session, *, org_id: int, feature: str) -> None:
         _raise_feature_denied(plan_code=plan_code, feature=str(feature))
 
 
+_DAILY_USAGE_METRICS = frozenset({"agent_run", "external_call", "automation_run", "premium_action"})
+
+
+@lru_cache(maxsize=64)
+def _day_window(day: date) -> tuple[datetime, datetime]:
+    start = datetime(year=day.year, month=day.month, day=day.day)
+    return start, start + timedelta(days=1)
+
+
+@lru_cache(maxsize=32)
+def _month_window(year: int, month: int) -> tuple[datetime, datetime]:
+    start = datetime(year=year, month=month, day=1)
+    if month == 12:
+        end = datetime(year=year + 1, month=1, day=1)
+    else:
+        end = datetime(year=year, month=month + 1, day=1)
+    return start, end
+
+
 def usage_window_for_metric(
     db: Session,
     *,
@@ -279,26 +381,16 @@ def usage_window_for_metric(
     metric: str,
     now: datetime | None = None,
 ) -> tuple[datetime, datetime]:
+    # Bounds only change at midnight / month rollover, so they are memoized on
+    # the calendar key rather than rebuilt for every limit check.
     now = now or _now()
     metric = str(metric)
 
-    if metric.endswith("_per_day") or metric in {
-        "agent_run",
-        "external_call",
-        "automation_run",
-        "premium_action",
-    }:
-        start = datetime(year=now.year, month=now.month, day=now.day)
-        end = start + timedelta(days=1)
-        return start, end
+    if metric.endswith("_per_day") or metric in _DAILY_USAGE_METRICS:
+        return _day_window(now.date())
 
     # default to monthly window
-    start = datetime(year=now.year, month=now.month, day=1)
-    if start.month == 12:
-        end = datetime(year=start.year + 1, month=1, day=1)
-    else:
-        end = datetime(year=start.year, month=start.month + 1, day=1)
-    return start, end
+    return _month_window(now.year, now.month)
 
 
 def _metric_column_name() -> str:
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Optional
 
-from sqlalchemy import and_, desc, func, select, text
+from sqlalchemy import bindparam, desc, func, lambda_stmt, or_, select, text
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.services.compliance_completion_service import compute_compliance_status
@@ -38,12 +38,13 @@ from onehaven_platform.backend.src.adapters.acquire_adapter import list_property
 from onehaven_platform.backend.src.services.inspection_readiness_service import build_property_readiness_summary
 from onehaven_platform.backend.src.services.jurisdiction_task_mapper_service import map_profile_jurisdiction_task_dicts
 from onehaven_platform.backend.src.adapters.intelligence_adapter import classify_deal_candidate
+from onehaven_platform.backend.src.shared_kernel import json_codec
 
 log = logging.getLogger("onehaven.state_machine")
 
 
 def _utcnow() -> datetime:
-    return datetime.utcnow()
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 def _safe_float(v: Any, default: float = 0.0) -> float:
@@ -62,7 +63,7 @@ def _safe_json_load(value: Any, fallback: Any):
         return value
     if isinstance(value, str):
         try:
-            parsed = json.loads(value)
+            parsed = json_codec.loads(value)
             return parsed
         except Exception:
             return fallback
@@ -71,7 +72,7 @@ def _safe_json_load(value: Any, fallback: Any):
 
 def _json_dumps(value: Any) -> str:
     try:
-        return json.dumps(value, separators=(",", ":"), sort_keys=True, default=str)
+        return json_codec.dumps(value, sort_keys=True, default=str)
     except Exception:
         return "{}"
 
@@ -155,7 +156,7 @@ def normalize_crime_label(score: Any) -> str:
     return "LOW"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChecklistProgress:
     total: int
     todo: int
@@ -182,17 +183,25 @@ class ChecklistProgress:
         }
 
 
-def ensure_state_row(db: Session, *, org_id: int, property_id: int) -> PropertyState:
+def ensure_state_row(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    now: Optional[datetime] = None,
+) -> PropertyState:
     row = db.scalar(
-        select(PropertyState).where(
-            PropertyState.org_id == org_id,
-            PropertyState.property_id == property_id,
+        lambda_stmt(
+            lambda: select(PropertyState).where(
+                PropertyState.org_id == org_id,
+                PropertyState.property_id == property_id,
+            )
         )
     )
     if row is not None:
         return row
 
-    now = _utcnow()
+    now = now or _utcnow()
     row = PropertyState(
         org_id=org_id,
         property_id=property_id,
@@ -208,34 +217,43 @@ def ensure_state_row(db: Session, *, org_id: int, property_id: int) -> PropertyS
     return row
 
 
+# The per-property lookups below run on every derivation. They are built as
+# lambda statements so SQLAlchemy caches the construct by the lambda's code and
+# only rebinds org_id / property_id, instead of rebuilding the expression tree.
 def _get_property(db: Session, *, org_id: int, property_id: int) -> Optional[Property]:
     return db.scalar(
-        select(Property).where(
-            Property.org_id == org_id,
-            Property.id == property_id,
+        lambda_stmt(
+            lambda: select(Property).where(
+                Property.org_id == org_id,
+                Property.id == property_id,
+            )
         )
     )
 
 
 def _latest_deal(db: Session, *, org_id: int, property_id: int) -> Optional[Deal]:
     return db.scalar(
-        select(Deal)
-        .where(and_(Deal.org_id == org_id, Deal.property_id == property_id))
-        .order_by(desc(Deal.updated_at), desc(Deal.id))
-        .limit(1)
+        lambda_stmt(
+            lambda: select(Deal)
+            .where(Deal.org_id == org_id, Deal.property_id == property_id)
+            .order_by(desc(Deal.updated_at), desc(Deal.id))
+            .limit(1)
+        )
     )
 
 
 def _latest_underwriting(db: Session, *, org_id: int, property_id: int) -> Optional[UnderwritingResult]:
     return db.scalar(
-        select(UnderwritingResult)
-        .join(Deal, Deal.id == UnderwritingResult.deal_id)
-        .where(
-            UnderwritingResult.org_id == org_id,
-            Deal.property_id == property_id,
+        lambda_stmt(
+            lambda: select(UnderwritingResult)
+            .join(Deal, Deal.id == UnderwritingResult.deal_id)
+            .where(
+                UnderwritingResult.org_id == org_id,
+                Deal.property_id == property_id,
+            )
+            .order_by(desc(UnderwritingResult.created_at), desc(UnderwritingResult.id))
+            .limit(1)
         )
-        .order_by(desc(UnderwritingResult.created_at), desc(UnderwritingResult.id))
-        .limit(1)
     )
 
 
@@ -355,33 +373,165 @@ def _decision_reason_list(uw: Optional[UnderwritingResult]) -> list[str]:
     return []
 
 
-def _checklist_progress(db: Session, *, org_id: int, property_id: int) -> ChecklistProgress:
-    rows = db.scalars(
-        select(PropertyChecklistItem.status).where(
+_CASH_INCOME_TYPES = ("income", "rent", "hap", "voucher")
+_ACQUISITION_MARK_TAGS = frozenset({"saved", "shortlisted", "offer_candidate"})
+_CASH_SCAN_LIMIT = 1000
+
+
+def _normalized_status(column: Any) -> Any:
+    return func.lower(func.trim(func.coalesce(column, "todo")))
+
+
+@lru_cache(maxsize=1)
+def _property_signals_stmt() -> Any:
+    """
+    Build the aggregate-signals SELECT once. org_id, property_id and now are
+    bound parameters, so every call reuses the same statement object and its
+    compiled form.
+    """
+    org_id = bindparam("org_id")
+    property_id = bindparam("property_id")
+    now = bindparam("now")
+
+    checklist_status = _normalized_status(PropertyChecklistItem.status)
+    checklist = (
+        select(
+            func.count(PropertyChecklistItem.id).label("checklist_total"),
+            func.count(PropertyChecklistItem.id).filter(checklist_status == "done").label("checklist_done"),
+            func.count(PropertyChecklistItem.id).filter(checklist_status == "failed").label("checklist_failed"),
+            func.count(PropertyChecklistItem.id).filter(checklist_status == "blocked").label("checklist_blocked"),
+            func.count(PropertyChecklistItem.id)
+            .filter(checklist_status == "in_progress")
+            .label("checklist_in_progress"),
+        )
+        .where(
             PropertyChecklistItem.org_id == org_id,
             PropertyChecklistItem.property_id == property_id,
         )
-    ).all()
+        .subquery("checklist_signals")
+    )
 
-    total = len(rows)
-    todo = in_progress = blocked = failed = done = 0
-
-    for status in rows:
-        st = str(status or "todo").strip().lower()
-        if st == "done":
-            done += 1
-        elif st == "failed":
-            failed += 1
-        elif st == "blocked":
-            blocked += 1
-        elif st == "in_progress":
-            in_progress += 1
-        else:
-            todo += 1
+    rehab_status = _normalized_status(RehabTask.status)
+    rehab = (
+        select(
+            func.count(RehabTask.id).label("rehab_total"),
+            func.count(RehabTask.id).filter(rehab_status == "done").label("rehab_done"),
+            func.count(RehabTask.id).filter(rehab_status == "blocked").label("rehab_blocked"),
+            func.count(RehabTask.id).filter(rehab_status == "in_progress").label("rehab_in_progress"),
+            func.coalesce(func.sum(RehabTask.cost_estimate), 0.0).label("rehab_cost_sum"),
+        )
+        .where(
+            RehabTask.org_id == org_id,
+            RehabTask.property_id == property_id,
+        )
+        .subquery("rehab_signals")
+    )
+
+    inspection = (
+        select(func.count(InspectionItem.id).label("open_failed_items"))
+        .select_from(InspectionItem)
+        .join(Inspection, Inspection.id == InspectionItem.inspection_id)
+        .where(
+            Inspection.org_id == org_id,
+            Inspection.property_id == property_id,
+            InspectionItem.failed.is_(True),
+            InspectionItem.resolved_at.is_(None),
+        )
+        .subquery("inspection_signals")
+    )
+
+    lease = (
+        select(
+            func.count(Lease.id).label("lease_count"),
+            func.max(Lease.id)
+            .filter(
+                Lease.start_date.is_not(None),
+                Lease.start_date <= now,
+                or_(Lease.end_date.is_(None), Lease.end_date >= now),
+            )
+            .label("active_lease_id"),
+        )
+        .where(
+            Lease.org_id == org_id,
+            Lease.property_id == property_id,
+        )
+        .subquery("lease_signals")
+    )
+
+    recent_txns = (
+        select(Transaction.amount, Transaction.txn_type)
+        .where(
+            Transaction.org_id == org_id,
+            Transaction.property_id == property_id,
+        )
+        .order_by(desc(Transaction.id))
+        .limit(_CASH_SCAN_LIMIT)
+        .subquery("recent_transactions")
+    )
+    is_income = func.lower(func.trim(func.coalesce(recent_txns.c.txn_type, ""))).in_(_CASH_INCOME_TYPES)
+    cash = (
+        select(
+            func.count().label("cash_count"),
+            func.coalesce(func.sum(recent_txns.c.amount).filter(is_income), 0.0).label("cash_income"),
+            func.coalesce(func.sum(recent_txns.c.amount).filter(~is_income), 0.0).label("cash_expense"),
+        )
+        .select_from(recent_txns)
+        .subquery("cash_signals")
+    )
+    cash_latest_date = (
+        select(func.coalesce(Transaction.txn_date, Transaction.created_at))
+        .where(
+            Transaction.org_id == org_id,
+            Transaction.property_id == property_id,
+        )
+        .order_by(desc(Transaction.id))
+        .limit(1)
+        .scalar_subquery()
+        .label("cash_latest_date")
+    )
+
+    return select(checklist, rehab, inspection, lease, cash, cash_latest_date)
+
+
+def _load_property_signals(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    now: Optional[datetime] = None,
+) -> dict[str, Any]:
+    """
+    Fetch every aggregate signal the stage derivation needs (checklist and
+    rehab status counts, open failed inspection items, lease activity and
+    cash totals) in a single round-trip. Each aggregate is a one-row
+    subquery, so selecting them side by side yields exactly one row.
+    """
+    row = db.execute(
+        _property_signals_stmt(),
+        {"org_id": int(org_id), "property_id": int(property_id), "now": now or _utcnow()},
+    ).mappings().one()
+    return dict(row)
+
+
+def _checklist_progress(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    signals: Optional[dict[str, Any]] = None,
+) -> ChecklistProgress:
+    if signals is None:
+        signals = _load_property_signals(db, org_id=org_id, property_id=property_id)
+
+    total = int(signals.get("checklist_total") or 0)
+    done = int(signals.get("checklist_done") or 0)
+    failed = int(signals.get("checklist_failed") or 0)
+    blocked = int(signals.get("checklist_blocked") or 0)
+    in_progress = int(signals.get("checklist_in_progress") or 0)
 
     return ChecklistProgress(
         total=total,
-        todo=todo,
+        todo=max(total - done - failed - blocked - in_progress, 0),
         in_progress=in_progress,
         blocked=blocked,
         failed=failed,
@@ -391,37 +541,37 @@ def _checklist_progress(db: Session, *, org_id: int, property_id: int) -> Checkl
 
 def _latest_inspection(db: Session, *, org_id: int, property_id: int) -> Optional[Inspection]:
     return db.scalar(
-        select(Inspection)
-        .where(
-            Inspection.org_id == org_id,
-            Inspection.property_id == property_id,
+        lambda_stmt(
+            lambda: select(Inspection)
+            .where(
+                Inspection.org_id == org_id,
+                Inspection.property_id == property_id,
+            )
+            .order_by(desc(Inspection.inspection_date), desc(Inspection.id))
+            .limit(1)
         )
-        .order_by(desc(Inspection.inspection_date), desc(Inspection.id))
-        .limit(1)
     )
 
 
-def _open_failed_inspection_items(db: Session, *, org_id: int, property_id: int) -> int:
-    try:
-        return int(
-            db.scalar(
-                select(func.count(InspectionItem.id))
-                .select_from(InspectionItem)
-                .join(Inspection, Inspection.id == InspectionItem.inspection_id)
-                .where(
-                    Inspection.org_id == org_id,
-                    Inspection.property_id == property_id,
-                    InspectionItem.failed.is_(True),
-                    InspectionItem.resolved_at.is_(None),
-                )
-            )
-            or 0
-        )
-    except Exception:
-        return 0
+def _open_failed_inspection_items(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    signals: Optional[dict[str, Any]] = None,
+) -> int:
+    if signals is None:
+        signals = _load_property_signals(db, org_id=org_id, property_id=property_id)
+    return int(signals.get("open_failed_items") or 0)
 
 
-def _inspection_summary(db: Session, *, org_id: int, property_id: int) -> dict[str, Any]:
+def _inspection_summary(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    signals: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
     insp = _latest_inspection(db, org_id=org_id, property_id=property_id)
     if insp is None:
         return {
@@ -436,7 +586,7 @@ def _inspection_summary(db: Session, *, org_id: int, property_id: int) -> dict[s
             "posture": "unknown",
         }
 
-    open_failed = _open_failed_inspection_items(db, org_id=org_id, property_id=property_id)
+    open_failed = _open_failed_inspection_items(db, org_id=org_id, property_id=property_id, signals=signals)
     latest_date = None
     if getattr(insp, "inspection_date", None) is not None:
         try:
@@ -463,34 +613,23 @@ def _inspection_summary(db: Session, *, org_id: int, property_id: int) -> dict[s
     }
 
 
-def _rehab_summary(db: Session, *, org_id: int, property_id: int) -> dict[str, Any]:
-    rows = db.scalars(
-        select(RehabTask).where(
-            RehabTask.org_id == org_id,
-            RehabTask.property_id == property_id,
-        )
-    ).all()
-
-    total = len(rows)
-    done = blocked = in_progress = todo = open_count = 0
-    cost_sum = 0.0
-
-    for row in rows:
-        status = str(getattr(row, "status", "todo") or "todo").strip().lower()
-        if status == "done":
-            done += 1
-        else:
-            open_count += 1
-
-        if status == "blocked":
-            blocked += 1
-        elif status == "in_progress":
-            in_progress += 1
-        elif status != "done":
-            todo += 1
+def _rehab_summary(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    signals: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    if signals is None:
+        signals = _load_property_signals(db, org_id=org_id, property_id=property_id)
 
-        if getattr(row, "cost_estimate", None) is not None:
-            cost_sum += _safe_float(getattr(row, "cost_estimate", None), 0.0)
+    total = int(signals.get("rehab_total") or 0)
+    done = int(signals.get("rehab_done") or 0)
+    blocked = int(signals.get("rehab_blocked") or 0)
+    in_progress = int(signals.get("rehab_in_progress") or 0)
+    open_count = total - done
+    todo = max(open_count - blocked - in_progress, 0)
+    cost_sum = _safe_float(signals.get("rehab_cost_sum"), 0.0)
 
     return {
         "total": total,
@@ -505,99 +644,53 @@ def _rehab_summary(db: Session, *, org_id: int, property_id: int) -> dict[str, A
     }
 
 
-def _lease_is_active(lease: Lease, now: datetime) -> bool:
-    start = getattr(lease, "start_date", None)
-    end = getattr(lease, "end_date", None)
-
-    if start is None:
-        return False
-
-    if isinstance(start, datetime):
-        start_ok = start <= now
-    elif isinstance(start, date):
-        start_ok = start <= now.date()
-    else:
-        try:
-            start_ok = datetime.fromisoformat(str(start)) <= now
-        except Exception:
-            start_ok = False
-
-    if not start_ok:
-        return False
-
-    if end is None:
-        return True
-
-    if isinstance(end, datetime):
-        return end >= now
-    if isinstance(end, date):
-        return end >= now.date()
-
-    try:
-        return datetime.fromisoformat(str(end)) >= now
-    except Exception:
-        return True
-
-
-def _lease_summary(db: Session, *, org_id: int, property_id: int) -> dict[str, Any]:
-    rows = db.scalars(
-        select(Lease)
-        .where(
-            Lease.org_id == org_id,
-            Lease.property_id == property_id,
-        )
-        .order_by(desc(Lease.id))
-    ).all()
+def _lease_summary(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    now: Optional[datetime] = None,
+    signals: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    if signals is None:
+        signals = _load_property_signals(db, org_id=org_id, property_id=property_id, now=now)
 
-    now = _utcnow()
-    active = None
-    for row in rows:
-        if _lease_is_active(row, now):
-            active = row
-            break
+    count = int(signals.get("lease_count") or 0)
+    active_lease_id = signals.get("active_lease_id")
 
     return {
-        "exists": len(rows) > 0,
-        "active": active is not None,
-        "active_lease_id": getattr(active, "id", None) if active is not None else None,
-        "count": len(rows),
+        "exists": count > 0,
+        "active": active_lease_id is not None,
+        "active_lease_id": active_lease_id,
+        "count": count,
     }
 
 
-def _cash_summary(db: Session, *, org_id: int, property_id: int) -> dict[str, Any]:
-    rows = db.scalars(
-        select(Transaction)
-        .where(
-            Transaction.org_id == org_id,
-            Transaction.property_id == property_id,
-        )
-        .order_by(desc(Transaction.id))
-        .limit(1000)
-    ).all()
-
-    income = 0.0
-    expense = 0.0
-    latest_date: Optional[str] = None
-
-    for row in rows:
-        amount = _safe_float(getattr(row, "amount", None), 0.0)
-        t = str(getattr(row, "txn_type", "") or "").strip().lower()
+def _cash_summary(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    signals: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    if signals is None:
+        signals = _load_property_signals(db, org_id=org_id, property_id=property_id)
 
-        if t in {"income", "rent", "hap", "voucher"}:
-            income += amount
-        else:
-            expense += amount
+    count = int(signals.get("cash_count") or 0)
+    income = _safe_float(signals.get("cash_income"), 0.0)
+    expense = _safe_float(signals.get("cash_expense"), 0.0)
 
-        dt = getattr(row, "txn_date", None) or getattr(row, "created_at", None)
-        if latest_date is None and dt is not None:
-            try:
-                latest_date = dt.isoformat()
-            except Exception:
-                latest_date = str(dt)
+    latest_date: Optional[str] = None
+    dt = signals.get("cash_latest_date")
+    if dt is not None:
+        try:
+            latest_date = dt.isoformat()
+        except Exception:
+            latest_date = str(dt)
 
     return {
-        "transaction_count": len(rows),
-        "has_transactions": len(rows) > 0,
+        "transaction_count": count,
+        "has_transactions": count > 0,
         "income": round(income, 2),
         "expense": round(expense, 2),
         "net": round(income - expense, 2),
@@ -711,18 +804,21 @@ def derive_stage_and_constraints(
     *,
     org_id: int,
     property_id: int,
+    now: Optional[datetime] = None,
 ) -> dict[str, Any]:
+    now = now or _utcnow()
     prop = _get_property(db, org_id=org_id, property_id=property_id)
     if prop is None:
         raise ValueError("property not found")
 
     deal = _latest_deal(db, org_id=org_id, property_id=property_id)
     uw = _latest_underwriting(db, org_id=org_id, property_id=property_id)
-    rehab = _rehab_summary(db, org_id=org_id, property_id=property_id)
-    checklist = _checklist_progress(db, org_id=org_id, property_id=property_id)
-    inspection = _inspection_summary(db, org_id=org_id, property_id=property_id)
-    lease = _lease_summary(db, org_id=org_id, property_id=property_id)
-    cash = _cash_summary(db, org_id=org_id, property_id=property_id)
+    signals = _load_property_signals(db, org_id=org_id, property_id=property_id, now=now)
+    rehab = _rehab_summary(db, org_id=org_id, property_id=property_id, signals=signals)
+    checklist = _checklist_progress(db, org_id=org_id, property_id=property_id, signals=signals)
+    inspection = _inspection_summary(db, org_id=org_id, property_id=property_id, signals=signals)
+    lease = _lease_summary(db, org_id=org_id, property_id=property_id, now=now, signals=signals)
+    cash = _cash_summary(db, org_id=org_id, property_id=property_id, signals=signals)
     valuation = _valuation_summary(db, org_id=org_id, property_id=property_id)
     jurisdiction = _jurisdiction_summary(db, org_id=org_id, prop=prop)
     readiness = build_property_readiness_summary(db, org_id=org_id, property_id=property_id)
@@ -730,10 +826,6 @@ def derive_stage_and_constraints(
     failure_actions = build_failure_next_actions(db, org_id=org_id, property_id=property_id, limit=10)
     failure_action_items = _failure_recommended_actions(failure_actions)
 
-    existing_row = ensure_state_row(db, org_id=org_id, property_id=property_id)
-    persisted_constraints = _safe_json_load(getattr(existing_row, "constraints_json", None), {})
-    if not isinstance(persisted_constraints, dict):
-        persisted_constraints = {}
     persisted_acquisition = _current_acquisition_record(db, org_id=org_id, property_id=property_id)
 
     readiness_info = readiness.get("readiness") or {}
@@ -794,13 +886,6 @@ def derive_stage_and_constraints(
     pursuit_status = str(persisted_acquisition.get("pursuit_status") or "").strip().lower()
     acquisition_stage_override = str(persisted_acquisition.get("stage") or "").strip().lower()
     manual_start_requested = bool(persisted_acquisition.get("start_requested") or persisted_acquisition.get("manual_start_approved"))
-    property_tags = {
-        str(row.get("tag") or "").strip().lower()
-        for row in list_property_tags(db, org_id=org_id, property_id=property_id)
-    }
-    has_saved_tag = "saved" in property_tags
-    has_shortlisted_tag = "shortlisted" in property_tags
-    has_offer_candidate_tag = "offer_candidate" in property_tags
     has_agent_owner = bool(
         persisted_acquisition.get("owner_user_id")
         or persisted_acquisition.get("owner_name")
@@ -833,12 +918,20 @@ def derive_stage_and_constraints(
             or persisted_acquisition.get("notes")
         )
     )
-    investor_marked_for_acquisition = bool(
-        manual_start_requested
-        or has_saved_tag
-        or has_shortlisted_tag
-        or has_offer_candidate_tag
-    )
+    # Tags only matter while an underwritten, non-rejected property waits to
+    # enter Acquire; every other stage skips the tag lookup.
+    investor_marked_for_acquisition = manual_start_requested
+    if (
+        not investor_marked_for_acquisition
+        and underwriting_complete
+        and decision_bucket != "REJECT"
+        and not acquired_complete
+    ):
+        property_tags = {
+            str(row.get("tag") or "").strip().lower()
+            for row in list_property_tags(db, org_id=org_id, property_id=property_id)
+        }
+        investor_marked_for_acquisition = bool(property_tags & _ACQUISITION_MARK_TAGS)
     start_acquisition_ready = bool(
         underwriting_complete
         and decision_bucket != "REJECT"
@@ -1327,9 +1420,34 @@ def _payload_from_row_snapshot(
     }
 
 
-def sync_property_state(db: Session, *, org_id: int, property_id: int) -> PropertyState:
-    state = derive_stage_and_constraints(db, org_id=org_id, property_id=property_id)
-    row = ensure_state_row(db, org_id=org_id, property_id=property_id)
+def sync_property_state(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    now: Optional[datetime] = None,
+    flush: bool = True,
+) -> PropertyState:
+    """
+    Derive and persist a property's state. Pass flush=False when syncing many
+    properties and flushing once at the end; the row is already tracked by the
+    session, so its changes are written at the next flush or commit.
+    """
+    row, _state = _sync_property_state(db, org_id=org_id, property_id=property_id, now=now, flush=flush)
+    return row
+
+
+def _sync_property_state(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    now: Optional[datetime] = None,
+    flush: bool = True,
+) -> tuple[PropertyState, dict[str, Any]]:
+    now = now or _utcnow()
+    state = derive_stage_and_constraints(db, org_id=org_id, property_id=property_id, now=now)
+    row = ensure_state_row(db, org_id=org_id, property_id=property_id, now=now)
 
     new_stage = clamp_stage(state["current_stage"])
     old_raw = getattr(row, "current_stage", None)
@@ -1337,17 +1455,32 @@ def sync_property_state(db: Session, *, org_id: int, property_id: int) -> Proper
     transition_reason = infer_transition_reason(old_stage, new_stage)
     state["transition_reason"] = transition_reason
 
-    row.current_stage = new_stage
-    row.constraints_json = _json_dumps(_attach_snapshot_to_constraints(state))
-    row.outstanding_tasks_json = _json_dumps(state["outstanding_tasks"])
-    row.updated_at = _utcnow()
+    # _json_dumps is key-sorted with fixed separators, so byte equality is a
+    # reliable change check; unchanged columns are left alone to avoid no-op UPDATEs.
+    constraints_json = _json_dumps(_attach_snapshot_to_constraints(state))
+    outstanding_tasks_json = _json_dumps(state["outstanding_tasks"])
+    changed = False
+
+    if old_raw != new_stage:
+        row.current_stage = new_stage
+        changed = True
+    if getattr(row, "constraints_json", None) != constraints_json:
+        row.constraints_json = constraints_json
+        changed = True
+    if getattr(row, "outstanding_tasks_json", None) != outstanding_tasks_json:
+        row.outstanding_tasks_json = outstanding_tasks_json
+        changed = True
+    if changed:
+        row.updated_at = now
 
     if hasattr(row, "last_transitioned_at") and old_stage is not None and new_stage != old_stage:
-        setattr(row, "last_transitioned_at", _utcnow())
+        setattr(row, "last_transitioned_at", now)
 
-    db.add(row)
-    db.flush()
-    return row
+    # ensure_state_row already attached the row; only pay for a flush when
+    # this sync actually dirtied it.
+    if flush and db.is_modified(row):
+        db.flush()
+    return row, state
 
 
 def get_state_payload(
@@ -1358,12 +1491,13 @@ def get_state_payload(
     recompute: bool = True,
 ) -> dict[str, Any]:
     row: Optional[PropertyState]
+    now = _utcnow()
 
     if recompute:
-        row = sync_property_state(db, org_id=org_id, property_id=property_id)
+        # Reuse the derivation the sync just did instead of deriving again.
+        row, snapshot = _sync_property_state(db, org_id=org_id, property_id=property_id, now=now)
         constraints = _safe_json_load(getattr(row, "constraints_json", None), {})
         outstanding = _safe_json_load(getattr(row, "outstanding_tasks_json", None), {})
-        snapshot = derive_stage_and_constraints(db, org_id=org_id, property_id=property_id)
         snapshot["constraints"] = constraints if isinstance(constraints, dict) else snapshot["constraints"]
         snapshot["outstanding_tasks"] = outstanding if isinstance(outstanding, dict) else snapshot["outstanding_tasks"]
         return _build_snapshot_payload(
@@ -1373,7 +1507,7 @@ def get_state_payload(
             last_transitioned_at=getattr(row, "last_transitioned_at", None),
         )
 
-    row = ensure_state_row(db, org_id=org_id, property_id=property_id)
+    row = ensure_state_row(db, org_id=org_id, property_id=property_id, now=now)
     payload = _payload_from_row_snapshot(row, property_id=property_id)
     if payload is not None:
         return payload
@@ -1383,12 +1517,11 @@ def get_state_payload(
         extra={"org_id": org_id, "property_id": property_id},
     )
 
-    row = sync_property_state(db, org_id=org_id, property_id=property_id)
+    row, snapshot = _sync_property_state(db, org_id=org_id, property_id=property_id, now=now)
     payload = _payload_from_row_snapshot(row, property_id=property_id)
     if payload is not None:
         return payload
 
-    snapshot = derive_stage_and_constraints(db, org_id=org_id, property_id=property_id)
     return _build_snapshot_payload(
         property_id=property_id,
         state=snapshot,
@@ -1397,6 +1530,40 @@ def get_state_payload(
     )
 
 
+def get_state_payloads(
+    db: Session,
+    *,
+    org_id: int,
+    property_ids: list[int],
+) -> dict[int, dict[str, Any]]:
+    """
+    Batch read path for listing endpoints.
+
+    Loads every PropertyState row for the requested properties in one query and
+    returns the stored snapshot payloads keyed by property_id. Properties with a
+    missing or legacy snapshot are left out so callers can fall back to
+    get_state_payload(recompute=False) for just those rows.
+    """
+    ids = sorted({int(pid) for pid in property_ids if pid is not None})
+    if not ids:
+        return {}
+
+    rows = db.scalars(
+        select(PropertyState).where(
+            PropertyState.org_id == org_id,
+            PropertyState.property_id.in_(ids),
+        )
+    ).all()
+
+    out: dict[int, dict[str, Any]] = {}
+    for row in rows:
+        property_id = int(row.property_id)
+        payload = _payload_from_row_snapshot(row, property_id=property_id)
+        if payload is not None:
+            out[property_id] = payload
+    return out
+
+
 def get_transition_payload(
     db: Session,
     *,
@@ -1,17 +1,18 @@
 # backend/app/services/usage_service.py
 from __future__ import annotations
 
-import json
 from dataclasses import asdict, dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import bindparam, func, insert, literal, select
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.models import AgentRun, ApiKey, Property, UsageLedger
 from onehaven_platform.backend.src.services import plan_service
+from onehaven_platform.backend.src.shared_kernel import json_codec
 
 
 @dataclass(frozen=True)
@@ -44,10 +45,14 @@ def _loads_json(s: str | None) -> dict[str, Any]:
     if not s:
         return {}
     try:
-        v = json.loads(s)
-        return dict(v) if isinstance(v, dict) else {}
-    except Exception:
+        v = json_codec.loads(s)
+    except ValueError:
         return {}
+    return dict(v) if isinstance(v, dict) else {}
+
+
+def _dumps_json(value: dict[str, Any] | None) -> str:
+    return json_codec.dumps(value or {}, sort_keys=True)
 
 
 def _metric_column_name() -> str:
@@ -78,8 +83,7 @@ def _day_key_column_name() -> str | None:
     return None
 
 
-def _count_usage(
-    db: Session,
+def _usage_sum_stmt(
     org_id: int,
     *,
     metric: str,
@@ -87,7 +91,7 @@ def _count_usage(
     end: datetime | None = None,
     provider: Optional[str] = None,
     day_key: str | None = None,
-) -> int:
+) -> Any:
     metric_col = getattr(UsageLedger, _metric_column_name())
 
     q = select(func.coalesce(func.sum(UsageLedger.units), 0)).where(
@@ -108,22 +112,65 @@ def _count_usage(
     if provider and provider_col_name:
         q = q.where(getattr(UsageLedger, provider_col_name) == str(provider))
 
-    return int(db.scalar(q) or 0)
+    return q
 
 
-def record_usage(
+@lru_cache(maxsize=None)
+def _usage_sum_template(use_day_key: bool, use_start: bool, use_end: bool, use_provider: bool) -> Any:
+    """Bind-parameter form of _usage_sum_stmt, built once per filter shape."""
+    metric_col = getattr(UsageLedger, _metric_column_name())
+
+    q = select(func.coalesce(func.sum(UsageLedger.units), 0)).where(
+        UsageLedger.org_id == bindparam("org_id"),
+        metric_col == bindparam("metric"),
+    )
+    if use_day_key:
+        q = q.where(getattr(UsageLedger, str(_day_key_column_name())) == bindparam("day_key"))
+    if use_start:
+        q = q.where(UsageLedger.created_at >= bindparam("start"))
+    if use_end:
+        q = q.where(UsageLedger.created_at < bindparam("end"))
+    if use_provider:
+        q = q.where(getattr(UsageLedger, str(_provider_column_name())) == bindparam("provider"))
+    return q
+
+
+def _count_usage(
     db: Session,
-    *,
     org_id: int,
+    *,
     metric: str,
-    units: int = 1,
-    provider: str | None = None,
-    ref_id: str | None = None,
-    meta: dict[str, Any] | None = None,
-    created_at: datetime | None = None,
-) -> None:
-    created_at = created_at or _now()
+    start: datetime | None = None,
+    end: datetime | None = None,
+    provider: Optional[str] = None,
+    day_key: str | None = None,
+) -> int:
+    params: dict[str, Any] = {"org_id": int(org_id), "metric": str(metric)}
+    use_day_key = bool(day_key and _day_key_column_name())
+    use_provider = bool(provider and _provider_column_name())
+    if use_day_key:
+        params["day_key"] = str(day_key)
+    if start is not None:
+        params["start"] = start
+    if end is not None:
+        params["end"] = end
+    if use_provider:
+        params["provider"] = str(provider)
+
+    q = _usage_sum_template(use_day_key, start is not None, end is not None, use_provider)
+    return int(db.scalar(q, params) or 0)
+
 
+def _usage_row_values(
+    *,
+    org_id: int,
+    metric: str,
+    units: int,
+    provider: str | None,
+    ref_id: str | None,
+    meta: dict[str, Any] | None,
+    created_at: datetime,
+) -> dict[str, Any]:
     kwargs: dict[str, Any] = {
         "org_id": int(org_id),
         "units": int(units),
@@ -143,16 +190,86 @@ def record_usage(
 
     meta_json_col_name = _meta_json_column_name()
     if meta_json_col_name:
-        kwargs[meta_json_col_name] = json.dumps(meta or {}, separators=(",", ":"), sort_keys=True)
+        kwargs[meta_json_col_name] = _dumps_json(meta)
 
     day_key_col_name = _day_key_column_name()
     if day_key_col_name:
         kwargs[day_key_col_name] = _day_key_utc(created_at)
 
+    return kwargs
+
+
+def record_usage(
+    db: Session,
+    *,
+    org_id: int,
+    metric: str,
+    units: int = 1,
+    provider: str | None = None,
+    ref_id: str | None = None,
+    meta: dict[str, Any] | None = None,
+    created_at: datetime | None = None,
+) -> None:
+    kwargs = _usage_row_values(
+        org_id=org_id,
+        metric=metric,
+        units=units,
+        provider=provider,
+        ref_id=ref_id,
+        meta=meta,
+        created_at=created_at or _now(),
+    )
     db.add(UsageLedger(**kwargs))
     db.flush()
 
 
+def _record_usage_within_limit(
+    db: Session,
+    *,
+    org_id: int,
+    metric: str,
+    units: int,
+    limit: int,
+    provider: str | None = None,
+    ref_id: str | None = None,
+    meta: dict[str, Any] | None = None,
+) -> bool:
+    """
+    Append a ledger row only if the metric's current window stays within
+    limit, as a single INSERT ... SELECT ... WHERE used + units <= limit.
+    Returns False, without writing, when the row would exceed the limit.
+    """
+    now = _now()
+    start, end = plan_service.usage_window_for_metric(db, org_id=int(org_id), metric=str(metric), now=now)
+    used = _usage_sum_stmt(
+        int(org_id),
+        metric=str(metric),
+        start=start,
+        end=end,
+        provider=provider,
+        day_key=_day_key_utc(now),
+    ).scalar_subquery()
+
+    values = _usage_row_values(
+        org_id=org_id,
+        metric=metric,
+        units=units,
+        provider=provider,
+        ref_id=ref_id,
+        meta=meta,
+        created_at=now,
+    )
+    columns = list(values)
+    source = select(
+        *[literal(values[name], type_=UsageLedger.__table__.c[name].type) for name in columns]
+    ).where(used + int(units) <= int(limit))
+
+    inserted = db.execute(
+        insert(UsageLedger).from_select(columns, source).returning(UsageLedger.id)
+    ).first()
+    return inserted is not None
+
+
 def increment_usage(
     db: Session,
     *,
@@ -259,6 +376,43 @@ def _limit_for_usage_metric(db: Session, *, org_id: int, metric: str) -> int | N
     return None if limit <= 0 else int(limit)
 
 
+_DAILY_LEDGER_METRICS = ("agent_run", "external_call", "automation_run", "premium_action")
+
+
+def _daily_usage_counts(
+    db: Session,
+    *,
+    org_id: int,
+    metrics: tuple[str, ...],
+    now: datetime | None = None,
+) -> dict[str, tuple[int, datetime, datetime]]:
+    """
+    Sum today's units for several daily ledger metrics in one GROUP BY query,
+    returning the same (used, window_start, window_end) triples that
+    _current_count_for_metric would compute one metric at a time.
+    """
+    now = now or _now()
+    start, end = plan_service.usage_window_for_metric(db, org_id=int(org_id), metric=metrics[0], now=now)
+    metric_col = getattr(UsageLedger, _metric_column_name())
+
+    q = (
+        select(metric_col, func.coalesce(func.sum(UsageLedger.units), 0))
+        .where(
+            UsageLedger.org_id == int(org_id),
+            metric_col.in_(metrics),
+            UsageLedger.created_at >= start,
+            UsageLedger.created_at < end,
+        )
+        .group_by(metric_col)
+    )
+    day_key_col_name = _day_key_column_name()
+    if day_key_col_name:
+        q = q.where(getattr(UsageLedger, day_key_col_name) == _day_key_utc(now))
+
+    used = {str(metric): int(total or 0) for metric, total in db.execute(q).all()}
+    return {metric: (used.get(metric, 0), start, end) for metric in metrics}
+
+
 def get_usage_snapshot(
     db: Session,
     *,
@@ -266,13 +420,32 @@ def get_usage_snapshot(
     metric: str,
     provider: str | None = None,
 ) -> UsageSnapshot:
-    plan_code = plan_service.get_plan_code(db, org_id=int(org_id))
     used, window_start, window_end = _current_count_for_metric(
         db,
         org_id=int(org_id),
         metric=str(metric),
         provider=provider,
     )
+    return _build_usage_snapshot(
+        db,
+        org_id=int(org_id),
+        metric=str(metric),
+        used=used,
+        window_start=window_start,
+        window_end=window_end,
+    )
+
+
+def _build_usage_snapshot(
+    db: Session,
+    *,
+    org_id: int,
+    metric: str,
+    used: int,
+    window_start: datetime | None,
+    window_end: datetime | None,
+) -> UsageSnapshot:
+    plan_code = plan_service.get_plan_code(db, org_id=int(org_id))
     limit = _limit_for_usage_metric(db, org_id=int(org_id), metric=str(metric))
     remaining = None if limit is None else max(0, int(limit) - int(used))
     allowed = True if limit is None else int(used) < int(limit) or remaining > 0
@@ -303,7 +476,26 @@ def get_usage_snapshots(
         "automation_run",
         "ingestion_run",
     ]
-    return [get_usage_snapshot(db, org_id=int(org_id), metric=m) for m in metrics]
+    daily_metrics = tuple(m for m in metrics if m in _DAILY_LEDGER_METRICS)
+    daily = _daily_usage_counts(db, org_id=int(org_id), metrics=daily_metrics)
+
+    snapshots: list[UsageSnapshot] = []
+    for metric in metrics:
+        if metric not in daily:
+            snapshots.append(get_usage_snapshot(db, org_id=int(org_id), metric=metric))
+            continue
+        used, window_start, window_end = daily[metric]
+        snapshots.append(
+            _build_usage_snapshot(
+                db,
+                org_id=int(org_id),
+                metric=metric,
+                used=used,
+                window_start=window_start,
+                window_end=window_end,
+            )
+        )
+    return snapshots
 
 
 def get_usage_snapshot_payload(
@@ -401,10 +593,32 @@ def consume_external_budget(
     ref_id: str | None = None,
     meta: dict[str, Any] | None = None,
 ) -> None:
-    snap = get_usage_snapshot(db, org_id=int(org_id), metric="external_call", provider=str(provider))
-    next_used = int(snap.used) + int(units)
+    limit = _limit_for_usage_metric(db, org_id=int(org_id), metric="external_call")
+    if limit is None:
+        record_usage(
+            db,
+            org_id=int(org_id),
+            metric="external_call",
+            units=int(units),
+            provider=str(provider),
+            ref_id=ref_id,
+            meta=meta or {},
+        )
+        return
 
-    if snap.limit is not None and next_used > int(snap.limit):
+    # Check and record in one statement; the snapshot is only needed to
+    # explain a rejection.
+    if not _record_usage_within_limit(
+        db,
+        org_id=int(org_id),
+        metric="external_call",
+        units=int(units),
+        limit=int(limit),
+        provider=str(provider),
+        ref_id=ref_id,
+        meta=meta or {},
+    ):
+        snap = get_usage_snapshot(db, org_id=int(org_id), metric="external_call", provider=str(provider))
         raise HTTPException(
             status_code=402,
             detail={
@@ -413,18 +627,8 @@ def consume_external_budget(
                 "provider": str(provider),
                 "used": int(snap.used),
                 "requested_units": int(units),
-                "limit": int(snap.limit),
+                "limit": int(limit),
                 "remaining": int(snap.remaining or 0),
                 "plan_code": snap.plan_code,
             },
-        )
-
-    record_usage(
-        db,
-        org_id=int(org_id),
-        metric="external_call",
-        units=int(units),
-        provider=str(provider),
-        ref_id=ref_id,
-        meta=meta or {},
-    )
\ No newline at end of file
+        )
\ No newline at end of file
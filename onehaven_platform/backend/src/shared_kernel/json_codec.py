@@ -0,0 +1,85 @@
+"""
+JSON text encoding shared by services that store or parse JSON columns.
+
+orjson is a declared dependency and does the work on the hot path; the
+stdlib json module is only used for inputs orjson would encode differently
+and for environments where the wheel is missing.
+
+dumps() returns the same JSON value json.dumps would for the same input,
+written compactly with non-ASCII left unescaped (the stdlib fallback uses
+the same settings, so both paths produce the same text). It is not
+byte-identical to json.dumps' defaults. Inputs the two encoders disagree on
+go through json:
+
+- dict keys that are not str (json coerces int/float/bool/None keys)
+- ints wider than 64 bits
+- NaN / Infinity (orjson would write null)
+
+datetime/date/time values and dataclasses are handed to ``default`` the way
+json does, instead of using orjson's native encoding.
+"""
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except Exception:
+    orjson = None  # type: ignore[assignment]
+
+_PASSTHROUGH = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson is not None else 0
+)
+
+
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def dumps(value: Any, *, sort_keys: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Encode value as JSON text. Raises TypeError/ValueError like json.dumps
+    for values neither encoder can handle.
+    """
+    if orjson is not None:
+        option = _PASSTHROUGH | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            out = orjson.dumps(value, default=default, option=option)
+        except TypeError:
+            # orjson.JSONEncodeError is a TypeError: non-str keys, big ints,
+            # or a type default could not handle. Let json decide.
+            pass
+        else:
+            # orjson writes NaN/Infinity as null; only walk the value when
+            # the output could contain one.
+            if b"null" not in out or not _has_non_finite(value):
+                return out.decode()
+    return json.dumps(
+        value,
+        sort_keys=sort_keys,
+        default=default,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def loads(raw: str | bytes | bytearray) -> Any:
+    """
+    Parse JSON text or UTF-8 bytes. Raises ValueError on invalid input.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except ValueError:
+            # NaN/Infinity literals written by json, or lone surrogates in a
+            # str, are rejected by orjson but accepted by json.
+            pass
+    return json.loads(raw)
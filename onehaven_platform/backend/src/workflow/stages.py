@@ -102,14 +102,40 @@ TRANSITION_REASONS: set[str] = {
     "manual_override",
 }
 
+_TRANSITION_REASON_BY_EDGE: dict[tuple[str, str], str] = {
+    ("discovered", "shortlisted"): "shortlisted",
+    ("shortlisted", "underwritten"): "underwriting_complete",
+    ("underwritten", "pursuing"): "start_acquisition",
+    ("pursuing", "offer_prep"): "offer_prep_ready",
+    ("offer_prep", "offer_ready"): "offer_ready",
+    ("offer_ready", "offer_submitted"): "offer_submitted",
+    ("offer_submitted", "negotiating"): "negotiation_started",
+    ("negotiating", "under_contract"): "under_contract",
+    ("under_contract", "due_diligence"): "due_diligence_started",
+    ("due_diligence", "closing"): "due_diligence_complete",
+    ("closing", "owned"): "acquisition_complete",
+    ("owned", "rehab"): "rehab_started",
+    ("rehab", "compliance_readying"): "rehab_complete",
+    ("compliance_readying", "inspection_pending"): "inspection_scheduled",
+    ("inspection_pending", "tenant_marketing"): "inspection_passed",
+    ("tenant_marketing", "tenant_screening"): "tenant_screening_started",
+    ("tenant_screening", "leased"): "lease_signed",
+    ("leased", "occupied"): "cashflow_started",
+    ("occupied", "maintenance"): "maintenance_required",
+    ("occupied", "turnover"): "vacancy_detected",
+    ("leased", "turnover"): "vacancy_detected",
+    ("tenant_screening", "turnover"): "vacancy_detected",
+    ("turnover", "inspection_pending"): "inspection_scheduled",
+    ("turnover", "tenant_marketing"): "tenant_marketing_ready",
+}
+
 
 def clamp_stage(stage: Optional[str]) -> str:
+    if stage in _RANK:
+        return stage
     raw = str(stage or "").strip().lower()
-    if raw in _RANK:
-        return raw
-    if raw in _ALIASES:
-        return _ALIASES[raw]
-    return "discovered"
+    # _ALIASES maps every canonical stage to itself, so one probe covers both.
+    return _ALIASES.get(raw, "discovered")
 
 
 def distinct_stages(values: list[str] | tuple[str, ...]) -> list[str]:
@@ -125,6 +151,9 @@ def distinct_stages(values: list[str] | tuple[str, ...]) -> list[str]:
 
 
 def stage_rank(stage: Optional[str]) -> int:
+    rank = _RANK.get(stage)
+    if rank is not None:
+        return rank
     return _RANK[clamp_stage(stage)]
 
 
@@ -173,33 +202,7 @@ def infer_transition_reason(previous_stage: Optional[str], current_stage: Option
     cur_key = clamp_stage(current_stage)
     if prev_key is None or prev_key == cur_key:
         return None
-    mapping = {
-        ("discovered", "shortlisted"): "shortlisted",
-        ("shortlisted", "underwritten"): "underwriting_complete",
-        ("underwritten", "pursuing"): "start_acquisition",
-        ("pursuing", "offer_prep"): "offer_prep_ready",
-        ("offer_prep", "offer_ready"): "offer_ready",
-        ("offer_ready", "offer_submitted"): "offer_submitted",
-        ("offer_submitted", "negotiating"): "negotiation_started",
-        ("negotiating", "under_contract"): "under_contract",
-        ("under_contract", "due_diligence"): "due_diligence_started",
-        ("due_diligence", "closing"): "due_diligence_complete",
-        ("closing", "owned"): "acquisition_complete",
-        ("owned", "rehab"): "rehab_started",
-        ("rehab", "compliance_readying"): "rehab_complete",
-        ("compliance_readying", "inspection_pending"): "inspection_scheduled",
-        ("inspection_pending", "tenant_marketing"): "inspection_passed",
-        ("tenant_marketing", "tenant_screening"): "tenant_screening_started",
-        ("tenant_screening", "leased"): "lease_signed",
-        ("leased", "occupied"): "cashflow_started",
-        ("occupied", "maintenance"): "maintenance_required",
-        ("occupied", "turnover"): "vacancy_detected",
-        ("leased", "turnover"): "vacancy_detected",
-        ("tenant_screening", "turnover"): "vacancy_detected",
-        ("turnover", "inspection_pending"): "inspection_scheduled",
-        ("turnover", "tenant_marketing"): "tenant_marketing_ready",
-    }
-    return mapping.get((prev_key, cur_key), f"{prev_key}_to_{cur_key}")
+    return _TRANSITION_REASON_BY_EDGE.get((prev_key, cur_key), f"{prev_key}_to_{cur_key}")
 
 
 @dataclass(frozen=True)
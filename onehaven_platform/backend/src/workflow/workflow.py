@@ -58,10 +58,17 @@ def upsert_state(payload: PropertyStateUpsert, db: Session = Depends(get_db), p=
     row = ensure_state_row(db, org_id=p.org_id, property_id=payload.property_id)
     existing_constraints = json.loads(row.constraints_json or "{}") if row.constraints_json else {}
     existing_tasks = json.loads(row.outstanding_tasks_json or "{}") if row.outstanding_tasks_json else {}
+    changed = False
     if payload.constraints is not None and isinstance(payload.constraints, dict):
-        existing_constraints.update(payload.constraints)
+        merged_constraints = {**existing_constraints, **payload.constraints}
+        if merged_constraints != existing_constraints:
+            row.constraints_json = json.dumps(merged_constraints)
+            changed = True
     if payload.outstanding_tasks is not None and isinstance(payload.outstanding_tasks, dict):
-        existing_tasks.update(payload.outstanding_tasks)
+        merged_tasks = {**existing_tasks, **payload.outstanding_tasks}
+        if merged_tasks != existing_tasks:
+            row.outstanding_tasks_json = json.dumps(merged_tasks)
+            changed = True
     if payload.current_stage is not None:
         computed = get_state_payload(db, org_id=p.org_id, property_id=payload.property_id, recompute=True)
         requested = clamp_stage(payload.current_stage)
@@ -75,12 +82,13 @@ def upsert_state(payload: PropertyStateUpsert, db: Session = Depends(get_db), p=
                 "next_actions": computed.get("next_actions") or [],
                 "workflow": build_workflow_summary(db, org_id=p.org_id, property_id=payload.property_id, principal=p, recompute=False),
             })
-        row.current_stage = requested
-    row.constraints_json = json.dumps(existing_constraints)
-    row.outstanding_tasks_json = json.dumps(existing_tasks)
-    row.updated_at = datetime.utcnow()
-    db.add(row)
-    db.commit()
+        if requested != row.current_stage:
+            row.current_stage = requested
+            changed = True
+    # Only rewrite the row when the merge actually changed something.
+    if changed:
+        row.updated_at = datetime.utcnow()
+        db.commit()
     sync_property_state(db, org_id=p.org_id, property_id=payload.property_id)
     db.commit()
     return {"state": get_state_payload(db, org_id=p.org_id, property_id=payload.property_id, recompute=True), "workflow": build_workflow_summary(db, org_id=p.org_id, property_id=payload.property_id, principal=p, recompute=False)}
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from sqlalchemy import MetaData, UniqueConstraint, create_engine
+from sqlalchemy.orm import Session
+
+from onehaven_platform.backend.src.services import plan_service
+from onehaven_platform.backend.src.services.plan_service import OrgSubscription
+from onehaven_platform.backend.src.models import Plan
+
+ORG_ID = 7
+
+
+@pytest.fixture()
+def db():
+    # Tables created before migration 0031 (kept by its _has_table guard) can
+    # hold several subscription rows per org, so build org_subscriptions
+    # without the per-org unique constraint to exercise "latest row wins".
+    metadata = MetaData()
+    Plan.__table__.to_metadata(metadata)
+    subs = OrgSubscription.__table__.to_metadata(metadata)
+    for constraint in [c for c in subs.constraints if isinstance(c, UniqueConstraint)]:
+        subs.constraints.discard(constraint)
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    plan_service.invalidate_plan_limits()
+    with Session(engine) as session:
+        for code in ("free", "pro"):
+            session.add(
+                Plan(
+                    code=code,
+                    name=code.title(),
+                    limits_json=json.dumps(plan_service.DEFAULT_PLANS[code]),
+                )
+            )
+        session.commit()
+        yield session
+    plan_service.invalidate_plan_limits()
+    engine.dispose()
+
+
+def _subscribe(db: Session, *, plan_code: str, status: str | None) -> None:
+    db.add(OrgSubscription(org_id=ORG_ID, plan_code=plan_code, status=status))
+    db.commit()
+
+
+def _max_properties(db: Session) -> int:
+    return int(plan_service.get_limits(db, org_id=ORG_ID)["max_properties"])
+
+
+def test_newer_inactive_subscription_falls_back_to_free(db):
+    _subscribe(db, plan_code="pro", status="active")
+    _subscribe(db, plan_code="pro", status="canceled")
+
+    assert plan_service.get_plan_code(db, org_id=ORG_ID) == "free"
+    assert _max_properties(db) == plan_service.DEFAULT_PLANS["free"]["limits"]["max_properties"]
+
+
+def test_latest_active_subscription_sets_limits(db):
+    _subscribe(db, plan_code="free", status="canceled")
+    _subscribe(db, plan_code="pro", status="active")
+
+    assert plan_service.get_plan_code(db, org_id=ORG_ID) == "pro"
+    assert _max_properties(db) == plan_service.DEFAULT_PLANS["pro"]["limits"]["max_properties"]
+
+
+def test_empty_status_counts_as_active(db):
+    _subscribe(db, plan_code="pro", status="")
+
+    assert plan_service.get_plan_code(db, org_id=ORG_ID) == "pro"
+    assert _max_properties(db) == plan_service.DEFAULT_PLANS["pro"]["limits"]["max_properties"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Iterable, Optional
 import json
 
@@ -217,37 +218,22 @@ def derive_categories_from_rule(jr: Optional[JurisdictionRule]) -> list[str]:
     return normalize_categories(categories)
 
 
-def compute_friction(jr: Optional[JurisdictionRule]) -> JurisdictionFriction:
+@lru_cache(maxsize=4096)
+def _friction_for(
+    rental_license_required: bool,
+    freq: str,
+    processing_days: int | None,
+    typical_fail_points_json: str | None,
+) -> tuple[float, tuple[JurisdictionFrictionReason, ...]]:
     """
-    Deterministic jurisdiction friction.
-
-    Returns:
-      - multiplier: float (<=1.0 generally)
-      - reasons: list[str] (legacy)
-      - reasons_trace: list[dict] (new)
+    Pure friction kernel over the handful of rule fields that drive it.
+    Many deals share a few jurisdictions, so results are memoized by value.
     """
     trace: list[JurisdictionFrictionReason] = []
-
-    if jr is None:
-        _push(
-            trace,
-            rule_field="missing_rule",
-            input_value=None,
-            weight=1.0,
-            delta=-0.05,
-            text="No jurisdiction data for city/state → REVIEW bias (unknown compliance friction).",
-        )
-        mult = 0.95
-        return JurisdictionFriction(
-            multiplier=mult,
-            reasons=[t.text for t in trace],
-            reasons_trace=[t.__dict__ for t in trace],
-        )
-
     mult = 1.0
 
     # License requirement
-    if bool(jr.rental_license_required):
+    if rental_license_required:
         delta = -0.05
         mult += delta
         _push(
@@ -260,7 +246,6 @@ def compute_friction(jr: Optional[JurisdictionRule]) -> JurisdictionFriction:
         )
 
     # Inspection frequency
-    freq = (getattr(jr, "inspection_frequency", None) or "").strip().lower()
     if freq == "annual":
         delta = -0.05
         mult += delta
@@ -305,9 +290,8 @@ def compute_friction(jr: Optional[JurisdictionRule]) -> JurisdictionFriction:
         )
 
     # Processing days
-    pd = getattr(jr, "processing_days", None)
-    if pd is not None:
-        pdv = int(pd)
+    if processing_days is not None:
+        pdv = processing_days
         if pdv >= 45:
             delta = -0.10
             mult += delta
@@ -344,7 +328,7 @@ def compute_friction(jr: Optional[JurisdictionRule]) -> JurisdictionFriction:
 
     # Typical fail points count heuristic
     try:
-        fps = json.loads(jr.typical_fail_points_json) if jr.typical_fail_points_json else []
+        fps = json.loads(typical_fail_points_json) if typical_fail_points_json else []
         if isinstance(fps, list) and len(fps) >= 6:
             delta = -0.05
             mult += delta
@@ -380,8 +364,47 @@ def compute_friction(jr: Optional[JurisdictionRule]) -> JurisdictionFriction:
     # Clamp (never negative / insane)
     mult = max(0.50, min(1.05, float(mult)))
 
+    return float(mult), tuple(trace)
+
+
+def compute_friction(jr: Optional[JurisdictionRule]) -> JurisdictionFriction:
+    """
+    Deterministic jurisdiction friction.
+
+    Returns:
+      - multiplier: float (<=1.0 generally)
+      - reasons: list[str] (legacy)
+      - reasons_trace: list[dict] (new)
+    """
+    trace: list[JurisdictionFrictionReason] = []
+
+    if jr is None:
+        _push(
+            trace,
+            rule_field="missing_rule",
+            input_value=None,
+            weight=1.0,
+            delta=-0.05,
+            text="No jurisdiction data for city/state → REVIEW bias (unknown compliance friction).",
+        )
+        mult = 0.95
+        return JurisdictionFriction(
+            multiplier=mult,
+            reasons=[t.text for t in trace],
+            reasons_trace=[t.__dict__ for t in trace],
+        )
+
+    pd = getattr(jr, "processing_days", None)
+    mult, cached_trace = _friction_for(
+        bool(jr.rental_license_required),
+        (getattr(jr, "inspection_frequency", None) or "").strip().lower(),
+        int(pd) if pd is not None else None,
+        jr.typical_fail_points_json or None,
+    )
+
+    # The cached reasons are shared; hand each caller its own lists/dicts.
     return JurisdictionFriction(
-        multiplier=float(mult),
-        reasons=[t.text for t in trace],
-        reasons_trace=[t.__dict__ for t in trace],
+        multiplier=mult,
+        reasons=[t.text for t in cached_trace],
+        reasons_trace=[dict(t.__dict__) for t in cached_trace],
     )
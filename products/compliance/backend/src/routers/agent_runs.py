@@ -22,7 +22,7 @@ from onehaven_platform.backend.src.services.agent_engine import (
     serialize_run,
 )
 from onehaven_platform.backend.src.services.agent_orchestrator import plan_agent_runs
-from onehaven_platform.backend.src.jobs.agent_tasks import execute_agent_run
+from onehaven_platform.backend.src.jobs.agent_tasks import dispatch_agent_runs, execute_agent_run
 
 router = APIRouter(prefix="/agent-runs", tags=["agents"])
 
@@ -406,9 +406,9 @@ def ack_deadletter(
         pass
 
     if changed:
+        # The response only echoes dead_id, so don't reload the row after commit.
         db.add(dead)
         db.commit()
-        db.refresh(dead)
 
     return {"ok": True, "dead_id": int(dead_id)}
 
@@ -589,6 +589,7 @@ def enqueue_planned_runs(
     plan = plan_agent_runs(db, org_id=principal.org_id, property_id=property_id)
 
     created: list[AgentRun] = []
+    queued_ids: list[int] = []
     for p in plan:
         run = create_run(
             db,
@@ -602,8 +603,9 @@ def enqueue_planned_runs(
         created.append(run)
 
         if dispatch and (getattr(run, "status", "") or "").lower() == "queued":
-            execute_agent_run.delay(org_id=principal.org_id, run_id=int(run.id))
+            queued_ids.append(int(run.id))
 
+    dispatch_agent_runs(org_id=principal.org_id, run_ids=queued_ids)
     return {"planned": len(plan), "created": [_serialize_run_detail(db, r) for r in created]}
 
 
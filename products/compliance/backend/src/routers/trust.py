@@ -5,13 +5,18 @@ import json
 from datetime import datetime
 from typing import Any, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.auth import get_principal, require_owner
 from onehaven_platform.backend.src.db import get_db
-from products.compliance.backend.src.services.trust_service import get_trust_score, recompute_and_persist, record_signal
+from products.compliance.backend.src.services.trust_service import (
+    get_trust_score,
+    get_trust_score_stale_ok,
+    recompute_and_persist,
+    record_signal,
+)
 
 router = APIRouter(prefix="/trust", tags=["trust"])
 
@@ -37,17 +42,23 @@ class TrustSignalIn(BaseModel):
 def get_trust(
     entity_type: str,
     entity_id: str,
+    background_tasks: BackgroundTasks,
     recompute: int = Query(default=0, description="1 = force recompute"),
     db: Session = Depends(get_db),
     p=Depends(get_principal),
 ):
-    row = get_trust_score(
-        db,
-        org_id=p.org_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        recompute=bool(recompute),
-    )
+    if recompute:
+        row = get_trust_score(db, org_id=p.org_id, entity_type=entity_type, entity_id=entity_id, recompute=True)
+    else:
+        # Stale scores are refreshed after the response; missing ones are
+        # computed inline.
+        row = get_trust_score_stale_ok(
+            db,
+            background_tasks,
+            org_id=p.org_id,
+            entity_type=entity_type,
+            entity_id=entity_id,
+        )
 
     try:
         components = json.loads(row.components_json) if row.components_json else {}
@@ -72,6 +83,7 @@ def inject_signal_and_recompute(
     entity_type: str,
     entity_id: str,
     payload: TrustSignalIn,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     p=Depends(get_principal),
     _owner=Depends(require_owner),
@@ -90,4 +102,4 @@ def inject_signal_and_recompute(
     recompute_and_persist(db, org_id=p.org_id, entity_type=entity_type, entity_id=entity_id)
     db.commit()
 
-    return get_trust(entity_type, entity_id, recompute=0, db=db, p=p)
+    return get_trust(entity_type, entity_id, background_tasks, recompute=0, db=db, p=p)
@@ -30,19 +30,19 @@ class HqsSummary:
     low: int = 0
 
 
+_STATUS_ALIASES: dict[str, str] = {
+    **dict.fromkeys(("pass", "passed", "ok", "complete"), "pass"),
+    **dict.fromkeys(("fail", "failed"), "fail"),
+    **dict.fromkeys(("blocked", "life_threatening", "lt"), "blocked"),
+    **dict.fromkeys(("na", "n/a", "not_applicable"), "na"),
+    **dict.fromkeys(("todo", "pending", "unknown", ""), "todo"),
+}
+
+
 def _norm_status(value: Any) -> str:
+    # One dict probe per item instead of up to five set-membership tests.
     raw = str(value or "").strip().lower()
-    if raw in {"pass", "passed", "ok", "complete"}:
-        return "pass"
-    if raw in {"fail", "failed"}:
-        return "fail"
-    if raw in {"blocked", "life_threatening", "lt"}:
-        return "blocked"
-    if raw in {"na", "n/a", "not_applicable"}:
-        return "na"
-    if raw in {"todo", "pending", "unknown", ""}:
-        return "todo"
-    return raw
+    return _STATUS_ALIASES.get(raw, raw)
 
 
 def _norm_designation(value: Any) -> str | None:
@@ -312,9 +312,11 @@ def create_rule(db: Session, *, org_id: int, actor_user_id: Optional[int], paylo
         updated_at=now,
     )
     db.add(row)
+    # Flush for the PK, then land the rule and its audit event in one commit.
+    db.flush()
+    audit_write(db, org_id=org_id, actor_user_id=actor_user_id, action="jurisdiction_rule_created", entity_type="jurisdiction_rule", entity_id=str(row.id), before=None, after=_jr_to_dict(row))
     db.commit()
     db.refresh(row)
-    audit_write(db, org_id=org_id, actor_user_id=actor_user_id, action="jurisdiction_rule_created", entity_type="jurisdiction_rule", entity_id=str(row.id), before=None, after=_jr_to_dict(row), commit=True)
     return row
 
 
@@ -343,9 +345,9 @@ def update_rule(db: Session, *, org_id: int, actor_user_id: Optional[int], rule_
         row.notes = payload.get("notes")
     row.updated_at = datetime.utcnow()
     db.add(row)
+    audit_write(db, org_id=org_id, actor_user_id=actor_user_id, action="jurisdiction_rule_updated", entity_type="jurisdiction_rule", entity_id=str(row.id), before=before, after=_jr_to_dict(row))
     db.commit()
     db.refresh(row)
-    audit_write(db, org_id=org_id, actor_user_id=actor_user_id, action="jurisdiction_rule_updated", entity_type="jurisdiction_rule", entity_id=str(row.id), before=before, after=_jr_to_dict(row), commit=True)
     return row
 
 
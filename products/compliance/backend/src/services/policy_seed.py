@@ -1,17 +1,17 @@
 # backend/app/services/policy_seed.py
 from __future__ import annotations
 
-import json
 from datetime import date, datetime
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.policy_models import JurisdictionProfile, HqsRule
+from onehaven_platform.backend.src.shared_kernel import json_codec
 
 
 def _j(v) -> str:
-    return json.dumps(v, separators=(",", ":"), ensure_ascii=False)
+    return json_codec.dumps(v)
 
 
 def ensure_policy_seeded(db: Session, *, org_id: int | None = None) -> None:
@@ -1,16 +1,23 @@
 # backend/app/services/trust_service.py
 from __future__ import annotations
 
-import json
+import heapq
+import logging
 import math
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
-from sqlalchemy import delete, desc, select
+from fastapi import BackgroundTasks
+from sqlalchemy import bindparam, case, delete, desc, func, select
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
+from onehaven_platform.backend.src.db import SessionLocal
 from onehaven_platform.backend.src.models import TrustSignal, TrustScore
+from onehaven_platform.backend.src.shared_kernel import json_codec
+
+log = logging.getLogger("onehaven.trust_service")
 
 
 @dataclass(frozen=True)
@@ -32,14 +39,14 @@ def _loads(s: Optional[str], default: Any) -> Any:
     if not s:
         return default
     try:
-        return json.loads(s)
+        return json_codec.loads(s)
     except Exception:
         return default
 
 
 def _dumps(v: Any) -> str:
     try:
-        return json.dumps(v)
+        return json_codec.dumps(v, default=str)
     except Exception:
         return "{}"
 
@@ -87,38 +94,123 @@ def clear_entity_signals(db: Session, *, org_id: int, entity_type: str, entity_i
     return int(res.rowcount or 0)
 
 
-def _confidence_from_evidence(*, total_weight: float, n_signals: int, newest_at: Optional[datetime]) -> float:
-    evidence = 1.0 - math.exp(-max(0.0, total_weight) / 6.0)
-    count = 1.0 - math.exp(-max(0, n_signals) / 12.0)
+# Decay rates for _confidence_from_evidence: evidence saturates over ~6
+# units of weight, count over ~12 signals, recency over one week.
+_EVIDENCE_RATE = 1.0 / 6.0
+_COUNT_RATE = 1.0 / 12.0
+_RECENCY_RATE = 1.0 / (7.0 * 24 * 3600.0)
 
-    recency = 0.5
-    if newest_at:
-        age = datetime.utcnow() - newest_at
-        recency = math.exp(-age.total_seconds() / (7.0 * 24 * 3600.0))
 
+def _confidence_from_evidence(
+    *,
+    total_weight: float,
+    n_signals: int,
+    newest_at: Optional[datetime],
+    now: Optional[datetime] = None,
+) -> float:
+    evidence = 1.0 - math.exp(-max(0.0, total_weight) * _EVIDENCE_RATE)
+    count = 1.0 - math.exp(-max(0, n_signals) * _COUNT_RATE)
+
+    if not newest_at:
+        # No dated evidence: recency counts as 0.5.
+        return _clamp(0.55 * evidence + 0.30 * count + 0.15 * 0.5, 0.0, 1.0)
+
+    age_seconds = ((now or datetime.utcnow()) - newest_at).total_seconds()
+    recency = math.exp(-age_seconds * _RECENCY_RATE)
     return _clamp(0.55 * evidence + 0.30 * count + 0.15 * recency, 0.0, 1.0)
 
 
-def _compute_components(signals: list[TrustSignal]) -> dict[str, Any]:
-    contribs: list[dict[str, Any]] = []
+_COMPONENT_COLUMNS = (
+    TrustSignal.id,
+    TrustSignal.signal_key,
+    TrustSignal.value,
+    TrustSignal.weight,
+    TrustSignal.created_at,
+    TrustSignal.meta_json,
+)
+
+
+# Statements below are built once with bind parameters; callers pass
+# org_id / entity_type / entity_id (and cutoff for signal windows).
+_STMT_TRUST_SCORE = select(TrustScore).where(
+    TrustScore.org_id == bindparam("org_id"),
+    TrustScore.entity_type == bindparam("entity_type"),
+    TrustScore.entity_id == bindparam("entity_id"),
+)
+_TRUST_SCORE_COLUMNS = tuple(column.key for column in TrustScore.__table__.columns)
+
+_SIGNAL_WINDOW = (
+    TrustSignal.org_id == bindparam("org_id"),
+    TrustSignal.entity_type == bindparam("entity_type"),
+    TrustSignal.entity_id == bindparam("entity_id"),
+    TrustSignal.created_at >= bindparam("cutoff"),
+)
+
+# Same coercions as the per-row Python path: a missing/zero weight counts
+# as 1, values are clamped to [0, 1] for the score, and non-positive
+# weights are left out of the weighted mean.
+_SIGNAL_WEIGHT = case((func.coalesce(TrustSignal.weight, 0.0) == 0.0, 1.0), else_=TrustSignal.weight)
+_SIGNAL_VALUE = func.coalesce(TrustSignal.value, 0.0)
+_SIGNAL_CLAMPED = case((_SIGNAL_VALUE < 0.0, 0.0), (_SIGNAL_VALUE > 1.0, 1.0), else_=_SIGNAL_VALUE)
+_SIGNAL_COUNTED = _SIGNAL_WEIGHT > 0.0
+
+_STMT_SIGNAL_AGGREGATE = select(
+    func.count(TrustSignal.id),
+    func.sum(_SIGNAL_WEIGHT).filter(_SIGNAL_COUNTED),
+    func.sum(_SIGNAL_CLAMPED * _SIGNAL_WEIGHT).filter(_SIGNAL_COUNTED),
+    func.max(TrustSignal.created_at).filter(_SIGNAL_COUNTED),
+).where(*_SIGNAL_WINDOW)
+
+_STMT_TOP_POSITIVE = (
+    select(*_COMPONENT_COLUMNS)
+    .where(*_SIGNAL_WINDOW)
+    .order_by((_SIGNAL_VALUE * _SIGNAL_WEIGHT).desc(), desc(TrustSignal.created_at), desc(TrustSignal.id))
+    .limit(3)
+)
+
+_STMT_TOP_NEGATIVE = (
+    select(*_COMPONENT_COLUMNS)
+    .where(*_SIGNAL_WINDOW)
+    .order_by(((_SIGNAL_VALUE - 1.0) * _SIGNAL_WEIGHT).asc(), desc(TrustSignal.created_at), desc(TrustSignal.id))
+    .limit(3)
+)
+
+
+def _compute_components(signals: list[Any], *, signal_count: Optional[int] = None) -> dict[str, Any]:
+    # signals are TrustSignal rows or plain column tuples selected with
+    # _COMPONENT_COLUMNS. (contribution, shortfall, signal) per row; only the
+    # top three each way are expanded into dicts, so meta_json is parsed at
+    # most six times.
+    scored: list[tuple[float, float, Any]] = []
     for s in signals:
-        v = float(getattr(s, "value", 0.0) or 0.0)
-        w = float(getattr(s, "weight", 1.0) or 1.0)
-        contribs.append(
-            {
+        v = float(s.value or 0.0)
+        w = float(s.weight or 1.0)
+        scored.append((v * w, (v - 1.0) * w, s))
+
+    positives = heapq.nlargest(3, scored, key=lambda x: x[0])
+    negatives = heapq.nsmallest(3, scored, key=lambda x: x[1])
+
+    expanded: dict[int, dict[str, Any]] = {}
+
+    def _component(item: tuple[float, float, Any]) -> dict[str, Any]:
+        contribution, _shortfall, s = item
+        out = expanded.get(id(s))
+        if out is None:
+            out = expanded[id(s)] = {
                 "signal_key": s.signal_key,
-                "value": v,
-                "weight": w,
-                "created_at": s.created_at.isoformat() if getattr(s, "created_at", None) else None,
-                "meta": _loads(getattr(s, "meta_json", None), None),
-                "contribution": v * w,
+                "value": float(s.value or 0.0),
+                "weight": float(s.weight or 1.0),
+                "created_at": s.created_at.isoformat() if s.created_at else None,
+                "meta": _loads(s.meta_json, None),
+                "contribution": contribution,
             }
-        )
+        return out
 
-    positives = sorted(contribs, key=lambda x: x["contribution"], reverse=True)
-    negatives = sorted(contribs, key=lambda x: (x["value"] - 1.0) * x["weight"])
-
-    return {"top_positive": positives[:3], "top_negative": negatives[:3], "signal_count": len(signals)}
+    return {
+        "top_positive": [_component(x) for x in positives],
+        "top_negative": [_component(x) for x in negatives],
+        "signal_count": len(signals) if signal_count is None else int(signal_count),
+    }
 
 
 def recompute_score(
@@ -128,39 +220,42 @@ def recompute_score(
     entity_type: str,
     entity_id: str,
     lookback_days: int = 90,
+    with_components: bool = True,
 ) -> TrustSnapshot:
-    cutoff = datetime.utcnow() - timedelta(days=int(lookback_days))
-
-    rows = list(
-        db.scalars(
-            select(TrustSignal)
-            .where(TrustSignal.org_id == int(org_id))
-            .where(TrustSignal.entity_type == str(entity_type))
-            .where(TrustSignal.entity_id == str(entity_id))
-            .where(TrustSignal.created_at >= cutoff)
-            .order_by(desc(TrustSignal.created_at), desc(TrustSignal.id))
-        ).all()
-    )
-
-    total_weight = 0.0
-    weighted_sum = 0.0
-    newest_at: Optional[datetime] = None
-
-    for s in rows:
-        w = float(getattr(s, "weight", 1.0) or 1.0)
-        v = _clamp(float(getattr(s, "value", 0.0) or 0.0), 0.0, 1.0)
-        if w <= 0:
-            continue
-        total_weight += w
-        weighted_sum += (v * w)
-        if newest_at is None:
-            newest_at = getattr(s, "created_at", None)
+    """
+    with_components=False computes score/confidence only and returns empty
+    components; use it when nobody reads the explain payload right away.
+    """
+    now = datetime.utcnow()
+    params = {
+        "org_id": int(org_id),
+        "entity_type": str(entity_type),
+        "entity_id": str(entity_id),
+        "cutoff": now - timedelta(days=int(lookback_days)),
+    }
+
+    n_signals, total_weight, weighted_sum, newest_at = db.execute(_STMT_SIGNAL_AGGREGATE, params).one()
+    n_signals = int(n_signals or 0)
+    total_weight = float(total_weight or 0.0)
+    weighted_sum = float(weighted_sum or 0.0)
 
     mean_0_1 = (weighted_sum / total_weight) if total_weight > 0 else 0.0
     score_0_100 = _clamp(mean_0_1 * 100.0, 0.0, 100.0)
 
-    confidence = _confidence_from_evidence(total_weight=total_weight, n_signals=len(rows), newest_at=newest_at)
-    components = _compute_components(rows)
+    confidence = _confidence_from_evidence(
+        total_weight=total_weight, n_signals=n_signals, newest_at=newest_at, now=now
+    )
+
+    components: dict[str, Any] = {}
+    if with_components:
+        # Only the top three signals each way are reported, so rank in SQL and
+        # load at most six rows instead of the whole lookback window.
+        ranked: dict[int, Any] = {}
+        for stmt in (_STMT_TOP_POSITIVE, _STMT_TOP_NEGATIVE):
+            for row in db.execute(stmt, params):
+                ranked[int(row.id)] = row
+        top_rows = sorted(ranked.values(), key=lambda r: (r.created_at, r.id), reverse=True)
+        components = _compute_components(top_rows, signal_count=n_signals)
 
     return TrustSnapshot(
         org_id=int(org_id),
@@ -173,6 +268,11 @@ def recompute_score(
     )
 
 
+# components_json of a score persisted with with_components=False. A full
+# recompute always stores the top_positive/top_negative/signal_count keys.
+_NO_COMPONENTS = "{}"
+
+
 def recompute_and_persist(
     db: Session,
     *,
@@ -180,14 +280,25 @@ def recompute_and_persist(
     entity_type: str,
     entity_id: str,
     lookback_days: int = 90,
+    with_components: bool = True,
 ) -> TrustScore:
-    snap = recompute_score(db, org_id=org_id, entity_type=entity_type, entity_id=entity_id, lookback_days=lookback_days)
+    """
+    with_components=False refreshes score/confidence and stores
+    _NO_COMPONENTS, so readers never pair the new score with an explain
+    payload from an earlier recompute.
+    """
+    snap = recompute_score(
+        db,
+        org_id=org_id,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        lookback_days=lookback_days,
+        with_components=with_components,
+    )
 
     row = db.scalar(
-        select(TrustScore)
-        .where(TrustScore.org_id == int(snap.org_id))
-        .where(TrustScore.entity_type == str(snap.entity_type))
-        .where(TrustScore.entity_id == str(snap.entity_id))
+        _STMT_TRUST_SCORE,
+        {"org_id": int(snap.org_id), "entity_type": str(snap.entity_type), "entity_id": str(snap.entity_id)},
     )
 
     if row is None:
@@ -197,14 +308,21 @@ def recompute_and_persist(
             entity_id=snap.entity_id,
             score=float(snap.score_0_100),
             confidence=float(snap.confidence_0_1),
-            components_json=_dumps(snap.components),
+            components_json=_dumps(snap.components) if with_components else _NO_COMPONENTS,
             updated_at=snap.updated_at,
         )
         db.add(row)
     else:
         row.score = float(snap.score_0_100)
         row.confidence = float(snap.confidence_0_1)
-        row.components_json = _dumps(snap.components)
+        if with_components:
+            # Leave the (possibly TOASTed) column out of the UPDATE when the
+            # explain payload is unchanged, which is common between signals.
+            components_json = _dumps(snap.components)
+            if components_json != row.components_json:
+                row.components_json = components_json
+        elif row.components_json != _NO_COMPONENTS:
+            row.components_json = _NO_COMPONENTS
         row.updated_at = snap.updated_at
         db.add(row)
 
@@ -220,15 +338,81 @@ def get_trust_score(
     recompute: bool = False,
 ) -> TrustScore:
     row = db.scalar(
-        select(TrustScore)
-        .where(TrustScore.org_id == int(org_id))
-        .where(TrustScore.entity_type == str(entity_type))
-        .where(TrustScore.entity_id == str(entity_id))
+        _STMT_TRUST_SCORE,
+        {"org_id": int(org_id), "entity_type": str(entity_type), "entity_id": str(entity_id)},
     )
 
     if row is None or recompute:
+        row = recompute_and_persist(db, org_id=int(org_id), entity_type=str(entity_type), entity_id=str(entity_id))
+        # Every column was just written from the snapshot, so put this row's
+        # values back after the commit expires it instead of refreshing it
+        # with a SELECT. Other objects in the session expire as usual.
+        db.flush()
+        written = {key: row.__dict__[key] for key in _TRUST_SCORE_COLUMNS if key in row.__dict__}
+        db.commit()
+        for key, value in written.items():
+            set_committed_value(row, key, value)
+
+    return row
+
+
+# A stored score younger than this is served as-is; an older one is
+# recomputed after the response instead of inline.
+_STALE_OK_MAX_AGE = timedelta(hours=1)
+
+
+def _recompute_and_commit_detached(*, org_id: int, entity_type: str, entity_id: str) -> None:
+    # Runs after the response is sent, so it cannot reuse the request session.
+    db = SessionLocal()
+    try:
+        recompute_and_persist(db, org_id=int(org_id), entity_type=str(entity_type), entity_id=str(entity_id))
+        db.commit()
+    except Exception:
+        db.rollback()
+        log.exception(
+            "trust_background_recompute_failed",
+            extra={"org_id": int(org_id), "entity_type": str(entity_type), "entity_id": str(entity_id)},
+        )
+    finally:
+        db.close()
+
+
+def get_trust_score_stale_ok(
+    db: Session,
+    background_tasks: BackgroundTasks,
+    *,
+    org_id: int,
+    entity_type: str,
+    entity_id: str,
+    max_age: timedelta = _STALE_OK_MAX_AGE,
+) -> TrustScore:
+    """
+    Read path for stored scores. A row older than max_age is returned as-is
+    and refreshed after the response. An entity with no stored row yet is
+    computed and persisted inline, as get_trust_score does.
+    """
+    row = db.scalar(
+        _STMT_TRUST_SCORE,
+        {"org_id": int(org_id), "entity_type": str(entity_type), "entity_id": str(entity_id)},
+    )
+
+    if row is None:
         row = recompute_and_persist(db, org_id=int(org_id), entity_type=str(entity_type), entity_id=str(entity_id))
         db.commit()
-        db.refresh(row)
+        return row
+
+    # A score persisted without components (see recompute_and_persist) is
+    # stale for readers of the explain payload, however recent it is.
+    if (
+        row.updated_at is None
+        or row.updated_at < datetime.utcnow() - max_age
+        or row.components_json in ("", _NO_COMPONENTS)
+    ):
+        background_tasks.add_task(
+            _recompute_and_commit_detached,
+            org_id=int(org_id),
+            entity_type=str(entity_type),
+            entity_id=str(entity_id),
+        )
 
     return row
@@ -28,6 +28,11 @@ _STRONG_DSCR = 1.30
 _STRONG_CASHFLOW = 400.0
 _MONEY_TOL = 2.0
 
+# Settings are fixed for the life of the process; read the per-evaluation
+# values once at import instead of on every deal.
+_DECISION_VERSION = str(settings.decision_version)
+_RENT_RULE_MIN_PCT = float(settings.rent_rule_min_pct)
+
 
 class EvaluatePropertiesIn(BaseModel):
     property_ids: list[int] = Field(default_factory=list)
@@ -140,13 +145,13 @@ def _rent_used_for_underwriting(
             return float(market), False, notes, computed_ceiling, "none", fmr_adjusted
 
         asking = float(getattr(d, "asking_price", 0.0) or 0.0)
-        est = asking * float(settings.rent_rule_min_pct)
+        est = asking * _RENT_RULE_MIN_PCT
         notes.append("Market strategy: missing market_rent_estimate; fell back to rent_rule_min_pct heuristic.")
         return float(est), True, notes, computed_ceiling, "none", fmr_adjusted
 
     if market is None and computed_ceiling is None:
         asking = float(getattr(d, "asking_price", 0.0) or 0.0)
-        est = asking * float(settings.rent_rule_min_pct)
+        est = asking * _RENT_RULE_MIN_PCT
         notes.append("Section 8: missing market_rent_estimate and ceiling; fell back to rent_rule_min_pct heuristic.")
         return float(est), True, notes, computed_ceiling, "none", fmr_adjusted
 
@@ -394,7 +399,7 @@ def evaluate_property_core(
             cash_on_cash=0.0,
             break_even_rent=0.0,
             min_rent_for_target_roi=0.0,
-            decision_version=str(settings.decision_version),
+            decision_version=_DECISION_VERSION,
         )
         db.add(existing)
         created = True
@@ -413,7 +418,7 @@ def evaluate_property_core(
     existing.break_even_rent = float(uw.break_even_rent)
     existing.min_rent_for_target_roi = float(uw.min_rent_for_target_roi)
 
-    existing.decision_version = str(settings.decision_version)
+    existing.decision_version = _DECISION_VERSION
     existing.payment_standard_pct_used = float(pct)
     existing.jurisdiction_multiplier = float(fr_mult)
     existing.jurisdiction_reasons_json = json.dumps(fr_reasons)
@@ -316,9 +316,13 @@ def _emit_rent_trust_signals(
             meta={},
         )
 
-        recompute_and_persist(db, org_id=org_id, entity_type="property", entity_id=str(property_id))
-        recompute_and_persist(db, org_id=org_id, entity_type="provider", entity_id="rentcast")
-        recompute_and_persist(db, org_id=org_id, entity_type="provider", entity_id="hud")
+        # Scores only. These rows store no components, so GET /trust treats
+        # them as stale and rebuilds the explain payload after responding.
+        recompute_and_persist(
+            db, org_id=org_id, entity_type="property", entity_id=str(property_id), with_components=False
+        )
+        recompute_and_persist(db, org_id=org_id, entity_type="provider", entity_id="rentcast", with_components=False)
+        recompute_and_persist(db, org_id=org_id, entity_type="provider", entity_id="hud", with_components=False)
     except Exception:
         pass
 
@@ -583,34 +587,40 @@ def _enrich_one(db: Session, property_id: int, org_id: int, strategy: str = "sec
     try:
         provider = "rentcast"
 
-        status = consume_external_budget(
-            db,
-            org_id=org_id,
-            provider=provider,
-            units=1,
-            meta={"endpoint": "rent_estimate", "property_id": property_id},
-            metric_key="external_calls_per_day",
-        )
-        budget_debug = {
-            "code": "ok",
-            "metric": status.metric,
-            "provider": status.provider,
-            "limit": status.limit,
-            "used": status.used,
-            "remaining": status.remaining,
-            "reset_at": status.reset_at,
+        rc = RentCastClient(getattr(settings, "rentcast_api_key", "") or "")
+        rc_request = {
+            "address": prop.address,
+            "city": prop.city,
+            "state": prop.state,
+            "zip_code": prop.zip,
+            "bedrooms": int(prop.bedrooms or 0),
+            "bathrooms": float(prop.bathrooms or 0),
+            "square_feet": prop.square_feet,
         }
 
-        rc = RentCastClient(getattr(settings, "rentcast_api_key", "") or "")
-        rc_payload = rc.rent_estimate(
-            address=prop.address,
-            city=prop.city,
-            state=prop.state,
-            zip_code=prop.zip,
-            bedrooms=int(prop.bedrooms or 0),
-            bathrooms=float(prop.bathrooms or 0),
-            square_feet=prop.square_feet,
-        )
+        # Only a real RentCast call is charged against the external budget.
+        rc_payload = rc.cached_rent_estimate(**rc_request)
+        if rc_payload is None:
+            status = consume_external_budget(
+                db,
+                org_id=org_id,
+                provider=provider,
+                units=1,
+                meta={"endpoint": "rent_estimate", "property_id": property_id},
+                metric_key="external_calls_per_day",
+            )
+            budget_debug = {
+                "code": "ok",
+                "metric": status.metric,
+                "provider": status.provider,
+                "limit": status.limit,
+                "used": status.used,
+                "remaining": status.remaining,
+                "reset_at": status.reset_at,
+            }
+            rc_payload = rc.rent_estimate(**rc_request)
+        else:
+            budget_debug = {"code": "cache_hit", "provider": provider}
 
         rentcast_ok = True
 
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 import urllib.parse
 import urllib.request
 from dataclasses import dataclass
 from typing import Any, Optional
 
+from onehaven_platform.backend.src.shared_kernel import json_codec
+
 
 @dataclass(frozen=True)
 class HttpResp:
@@ -17,11 +18,15 @@ def _http_get_json(url: str, headers: dict[str, str], timeout_s: int = 20) -> Ht
     req = urllib.request.Request(url, headers=headers, method="GET")
     try:
         with urllib.request.urlopen(req, timeout=timeout_s) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
+            # Parse the bytes directly; only the error branch needs a str.
+            raw = resp.read()
             try:
-                payload = json.loads(raw) if raw else None
-            except json.JSONDecodeError:
-                payload = {"_raw": raw}
+                if not raw:
+                    payload = None
+                else:
+                    payload = json_codec.loads(raw)
+            except ValueError:
+                payload = {"_raw": raw.decode("utf-8", errors="replace")}
             return HttpResp(status=int(resp.status), data=payload)
     except Exception as e:
         return HttpResp(status=0, data={"error": str(e), "url": url})
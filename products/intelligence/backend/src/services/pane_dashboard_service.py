@@ -17,7 +17,10 @@ from onehaven_platform.backend.src.domain.workflow.panes import (
     pane_label,
 )
 from onehaven_platform.backend.src.models import Deal, Property, UnderwritingResult
-from onehaven_platform.backend.src.services.state_machine_service import get_state_payload
+from onehaven_platform.backend.src.services.state_machine_service import (
+    get_state_payload,
+    get_state_payloads,
+)
 from products.intelligence.backend.src.services.risk_scoring import classify_deal_candidate, compute_risk_adjusted_score
 from products.intelligence.backend.src.domain.underwriting import compute_monthly_housing_costs
 from products.ops.backend.src.services.properties.inventory_snapshot_service import build_property_inventory_snapshot
@@ -934,14 +937,21 @@ def _build_rows_for_scope(
     skipped_errors = 0
 
     build_t0 = time.perf_counter()
+    state_payloads = get_state_payloads(
+        db,
+        org_id=org_id,
+        property_ids=[int(prop.id) for prop in props],
+    )
     for prop in props:
         try:
-            state_payload = get_state_payload(
-                db,
-                org_id=org_id,
-                property_id=int(prop.id),
-                recompute=False,
-            )
+            state_payload = state_payloads.get(int(prop.id))
+            if state_payload is None:
+                state_payload = get_state_payload(
+                    db,
+                    org_id=org_id,
+                    property_id=int(prop.id),
+                    recompute=False,
+                )
             rows.append(
                 _build_row(
                     db,
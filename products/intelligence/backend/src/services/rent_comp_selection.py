@@ -1,52 +1,64 @@
 # onehaven_decision_engine/backend/app/services/rent_comp_selection.py
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import case, func, literal, select
 from sqlalchemy.orm import Session
 
-from onehaven_platform.backend.src.models import Property
-from onehaven_platform.backend.src.policy_models import RentComp
+from onehaven_platform.backend.src.models import Property, RentComp
 
 
-@dataclass(frozen=True)
-class ScoredComp:
-    comp: RentComp
-    score: float
+def _non_negative(expr):
+    return case((expr > 0.0, expr), else_=0.0)
 
 
-def _score(prop: Property, c: RentComp) -> float:
+def _score_expr(prop: Property):
     """
-    Deterministic similarity score (higher is better).
+    Deterministic similarity score (higher is better), computed in SQL so
+    ranking happens in the database.
     v1 factors:
       - bedrooms exact match heavily weighted
-      - city match
+      - city match, against the city of the Property the comp was recorded
+        for (RentComp has no city of its own)
       - sqft proximity if present
     """
-    score = 0.0
+    score = literal(0.0)
+
     pb = int(prop.bedrooms or 0)
-    cb = int(getattr(c, "bedrooms", 0) or 0)
-    if pb and cb:
-        score += 10.0 if pb == cb else max(0.0, 10.0 - abs(pb - cb) * 3.0)
+    if pb:
+        cb = func.coalesce(RentComp.bedrooms, 0)
+        score = score + case(
+            (cb == 0, 0.0),
+            (cb == pb, 10.0),
+            else_=_non_negative(10.0 - func.abs(cb - pb) * 3.0),
+        )
 
     pc = (prop.city or "").strip().lower()
-    cc = (getattr(c, "city", None) or "").strip().lower()
-    if pc and cc and pc == cc:
-        score += 4.0
+    if pc:
+        score = score + case((func.lower(func.trim(Property.city)) == pc, 4.0), else_=0.0)
 
     psq = float(prop.square_feet or 0.0)
-    csq = float(getattr(c, "square_feet", 0.0) or 0.0)
-    if psq > 0 and csq > 0:
-        diff = abs(psq - csq)
-        score += max(0.0, 3.0 - (diff / 500.0))
+    if psq > 0:
+        csq = func.coalesce(RentComp.square_feet, 0)
+        score = score + case(
+            (csq > 0, _non_negative(3.0 - func.abs(csq - psq) / 500.0)),
+            else_=0.0,
+        )
 
     return score
 
 
 def select_best_comps(db: Session, *, org_id: int, prop: Property, limit: int = 5) -> list[RentComp]:
-    rows = db.scalars(select(RentComp).where(RentComp.org_id == org_id)).all()
-    scored = [ScoredComp(comp=r, score=_score(prop, r)) for r in rows]
-    scored.sort(key=lambda x: x.score, reverse=True)
-    return [s.comp for s in scored[: max(0, int(limit))]]
\ No newline at end of file
+    limit = max(0, int(limit))
+    if limit == 0:
+        return []
+
+    stmt = (
+        select(RentComp)
+        .join(Property, Property.id == RentComp.property_id)
+        .where(Property.org_id == org_id)
+        .order_by(_score_expr(prop).desc(), RentComp.id)
+        .limit(limit)
+    )
+    return list(db.scalars(stmt).all())
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import desc, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 
 from onehaven_platform.backend.src.auth import get_principal, require_operator
@@ -36,7 +36,7 @@ router = APIRouter(prefix="/ops", tags=["ops"])
 
 
 def _now_utc() -> datetime:
-    return datetime.utcnow()
+    return datetime.now(timezone.utc).replace(tzinfo=None)
 
 
 def _loads(s: Optional[str], default: Any):
@@ -57,18 +57,23 @@ def _num(v: Any) -> float:
         return 0.0
 
 
+_INCOME_TXN_TYPES = ("income", "rent", "hap", "voucher")
+_EXPENSE_TXN_TYPES = ("expense", "repair", "maintenance", "mortgage", "insurance", "tax")
+_CAPEX_TXN_TYPES = ("capex",)
+
+
 def _txn_bucket(txn_type: str | None) -> str:
     t = (txn_type or "").lower().strip()
-    if t in {"income", "rent", "hap", "voucher"}:
+    if t in _INCOME_TXN_TYPES:
         return "income"
-    if t in {"expense", "repair", "maintenance", "mortgage", "insurance", "tax"}:
+    if t in _EXPENSE_TXN_TYPES:
         return "expense"
-    if t in {"capex"}:
+    if t in _CAPEX_TXN_TYPES:
         return "capex"
     return "other"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChecklistProgress:
     total: int
     todo: int
@@ -161,8 +166,14 @@ def _rehab_summary(db: Session, *, org_id: int, property_id: int) -> dict[str, A
     }
 
 
-def _active_lease(db: Session, *, org_id: int, property_id: int) -> Optional[Lease]:
-    now = _now_utc()
+def _active_lease(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    now: Optional[datetime] = None,
+) -> Optional[Lease]:
+    now = now or _now_utc()
     rows = db.scalars(
         select(Lease)
         .where(Lease.org_id == org_id, Lease.property_id == property_id)
@@ -193,38 +204,69 @@ def _latest_valuation(db: Session, *, org_id: int, property_id: int) -> Optional
     )
 
 
-def _cash_rollup(db: Session, *, org_id: int, property_id: int, days: int) -> dict[str, float]:
-    since = _now_utc() - timedelta(days=days)
-    rows = db.scalars(
-        select(Transaction)
-        .where(Transaction.org_id == org_id, Transaction.property_id == property_id)
-        .order_by(desc(Transaction.txn_date), desc(Transaction.id))
-    ).all()
+def _cash_rollups(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    windows: tuple[int, ...],
+    now: Optional[datetime] = None,
+) -> dict[int, dict[str, float]]:
+    """
+    Income/expense/capex rollups for several trailing windows in one query:
+    each window is a set of FILTERed sums over the widest window's rows.
+    """
+    windows = tuple(sorted({int(d) for d in windows}))
+    if not windows:
+        return {}
+
+    now = now or _now_utc()
+    txn_type = func.lower(func.trim(func.coalesce(Transaction.txn_type, "")))
+    buckets = (
+        ("income", Transaction.amount, _INCOME_TXN_TYPES),
+        ("expense", func.abs(Transaction.amount), _EXPENSE_TXN_TYPES),
+        ("capex", func.abs(Transaction.amount), _CAPEX_TXN_TYPES),
+    )
 
-    income = expense = capex = 0.0
-    for r in rows:
-        dt = r.txn_date or _now_utc()
-        if dt < since:
-            continue
-        amt = _num(r.amount)
-        bucket = _txn_bucket(getattr(r, "txn_type", None))
-        if bucket == "income":
-            income += amt
-        elif bucket == "expense":
-            expense += abs(amt)
-        elif bucket == "capex":
-            capex += abs(amt)
+    columns = []
+    for days in windows:
+        in_window = Transaction.txn_date >= now - timedelta(days=days)
+        for _, amount, types in buckets:
+            columns.append(func.coalesce(func.sum(amount).filter(in_window, txn_type.in_(types)), 0.0))
+
+    row = db.execute(
+        select(*columns).where(
+            Transaction.org_id == org_id,
+            Transaction.property_id == property_id,
+            Transaction.txn_date >= now - timedelta(days=windows[-1]),
+        )
+    ).one()
+
+    out: dict[int, dict[str, float]] = {}
+    values = iter(row)
+    for days in windows:
+        income, expense, capex = (_num(next(values)) for _ in buckets)
+        out[days] = {
+            "income": round(income, 2),
+            "expense": round(expense, 2),
+            "capex": round(capex, 2),
+            "net": round(income - expense - capex, 2),
+        }
+    return out
 
-    return {
-        "income": round(income, 2),
-        "expense": round(expense, 2),
-        "capex": round(capex, 2),
-        "net": round(income - expense - capex, 2),
-    }
 
+def _cash_rollup(db: Session, *, org_id: int, property_id: int, days: int) -> dict[str, float]:
+    return _cash_rollups(db, org_id=org_id, property_id=property_id, windows=(days,))[int(days)]
 
-def _tenant_summary(db: Session, *, org_id: int, property_id: int) -> dict[str, Any]:
-    now = _now_utc()
+
+def _tenant_summary(
+    db: Session,
+    *,
+    org_id: int,
+    property_id: int,
+    now: Optional[datetime] = None,
+) -> dict[str, Any]:
+    now = now or _now_utc()
     leases = list(
         db.scalars(
             select(Lease)
@@ -409,11 +451,14 @@ def property_ops_summary(
     open_failed_items = _open_failed_inspection_items(db, org_id=p.org_id, property_id=property_id)
     rehab = _rehab_summary(db, org_id=p.org_id, property_id=property_id)
 
-    tenant = _tenant_summary(db, org_id=p.org_id, property_id=property_id)
-    active_lease = _active_lease(db, org_id=p.org_id, property_id=property_id)
+    # One clock read for every time-windowed section of the summary.
+    now = _now_utc()
+    tenant = _tenant_summary(db, org_id=p.org_id, property_id=property_id, now=now)
+    active_lease = _active_lease(db, org_id=p.org_id, property_id=property_id, now=now)
 
-    cash_30 = _cash_rollup(db, org_id=p.org_id, property_id=property_id, days=30)
-    cash_n = _cash_rollup(db, org_id=p.org_id, property_id=property_id, days=cash_days)
+    cash = _cash_rollups(db, org_id=p.org_id, property_id=property_id, windows=(30, cash_days), now=now)
+    cash_30 = cash[30]
+    cash_n = cash[int(cash_days)]
 
     equity = _equity_summary(db, org_id=p.org_id, property_id=property_id)
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta
 from typing import Optional, Any
 
 from sqlalchemy import select, and_, or_
@@ -24,18 +24,6 @@ def _as_date(v: Any) -> Optional[date]:
         return None
 
 
-def _overlaps(a_start: date, a_end: Optional[date], b_start: date, b_end: Optional[date]) -> bool:
-    """
-    Overlap rule:
-    - Treat end dates as inclusive.
-    - If end is None, treat it as open-ended.
-    """
-    # open-ended becomes "infinite"
-    a_end_eff = a_end or date.max
-    b_end_eff = b_end or date.max
-    return not (a_end_eff < b_start or b_end_eff < a_start)
-
-
 @dataclass(frozen=True)
 class LeaseOverlapResult:
     ok: bool
@@ -43,6 +31,10 @@ class LeaseOverlapResult:
     message: Optional[str] = None
 
 
+class LeaseOverlapError(ValueError):
+    pass
+
+
 def ensure_no_lease_overlap(
     db: Session,
     *,
@@ -55,7 +47,8 @@ def ensure_no_lease_overlap(
     ignore_lease_id: Optional[int] = None,
 ) -> None:
     """
-    Raise ValueError if an overlapping lease exists.
+    Raise LeaseOverlapError (a ValueError) if an overlapping lease exists, or
+    ValueError if the dates themselves are invalid.
 
     Supports multiple schema styles:
     - Some repos use Lease.unit_id (int FK)
@@ -99,22 +92,21 @@ def ensure_no_lease_overlap(
     if ignore_lease_id is not None:
         q = q.where(Lease.id != int(ignore_lease_id))
 
-    rows = db.scalars(q.order_by(Lease.id.desc())).all()
-
-    # Determine the model's date fields
-    # Common patterns: start_date/end_date, lease_start/lease_end, start_at/end_at
-    for r in rows:
-        r_start = _as_date(getattr(r, "start_date", None) or getattr(r, "lease_start", None) or getattr(r, "start_at", None))
-        r_end = _as_date(getattr(r, "end_date", None) or getattr(r, "lease_end", None) or getattr(r, "end_at", None))
-
-        if r_start is None:
-            # corrupt row; skip rather than crash
-            continue
-
-        if _overlaps(s, e, r_start, r_end):
-            # Conflict found
-            raise ValueError(
-                f"lease dates overlap with existing lease id={int(getattr(r, 'id'))} "
-                f"({r_start.isoformat()} → {(r_end.isoformat() if r_end else 'open-ended')})"
-            )
-        
\ No newline at end of file
+    # Push the overlap predicate into SQL instead of loading every lease for the
+    # property and comparing in Python. End dates are inclusive and a missing
+    # end is open-ended; on the DateTime columns that reads:
+    #   existing.start (as date) <= new.end   and   existing.end (as date) >= new.start
+    q = q.where(or_(Lease.end_date.is_(None), Lease.end_date >= datetime.combine(s, time.min)))
+    if e is not None:
+        q = q.where(Lease.start_date < datetime.combine(e + timedelta(days=1), time.min))
+
+    r = db.scalars(q.order_by(Lease.id.desc()).limit(1)).first()
+    if r is None:
+        return
+
+    r_start = _as_date(r.start_date)
+    r_end = _as_date(r.end_date)
+    raise LeaseOverlapError(
+        f"lease dates overlap with existing lease id={int(r.id)} "
+        f"({r_start.isoformat()} → {(r_end.isoformat() if r_end else 'open-ended')})"
+    )